@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import socket
-import threading
+import asyncio
+import codecs
+import os
 import sys
+import threading
+
+
+# 소켓 read 1회당 최대 수신 크기
+RECV_SIZE = 4096
 
 
 class ChatClient:
@@ -11,73 +17,116 @@ class ChatClient:
     간단한 콘솔 클라이언트.
     - 서버 접속 후 안내에 따라 닉네임을 입력
     - 일반 메시지/귓속말/종료 명령 전송
+    - 표준입력과 서버 수신을 하나의 asyncio 이벤트 루프에서 함께 처리
     """
 
     def __init__(self, host='127.0.0.1', port=5000):
         self.host = host
         self.port = port
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.receiver_thread = None
+        self.reader = None
+        self.writer = None
         self.running = False
 
     def start(self):
-        self.sock.connect((self.host, self.port))
-        self.running = True
-
-        self.receiver_thread = threading.Thread(target=self._recv_loop, daemon=True)
-        self.receiver_thread.start()
-
         try:
-            while self.running:
-                line = sys.stdin.readline()
-                if not line:
-                    # EOF
-                    self.stop()
-                    break
+            asyncio.run(self.run())
+        except KeyboardInterrupt:
+            pass
 
-                msg = line.rstrip('\n')
-                try:
-                    self.sock.sendall((msg + '\n').encode('utf-8'))
-                except OSError:
-                    print('시스템> 서버와의 연결이 종료되었습니다.')
-                    self.stop()
-                    break
+    async def run(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.running = True
 
-                if msg == '/종료':
-                    self.stop()
-                    break
-        except KeyboardInterrupt:
-            self.stop()
+        stdin_task = asyncio.create_task(self._pump_stdin())
+        sock_task = asyncio.create_task(self._pump_sock())
+        try:
+            # 입력 종료(/종료, EOF)나 서버 연결 종료 중 하나가 먼저 끝나면 정리
+            await asyncio.wait({stdin_task, sock_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stdin_task.cancel()
+            sock_task.cancel()
+            await self.stop()
 
-    def stop(self):
+    async def stop(self):
         if not self.running:
             return
         self.running = False
+        self.writer.close()
         try:
-            self.sock.shutdown(socket.SHUT_RDWR)
-        except OSError:
-            pass
-        try:
-            self.sock.close()
+            await self.writer.wait_closed()
         except OSError:
             pass
 
-    def _recv_loop(self):
+    async def _pump_stdin(self):
+        stdin = await self._open_stdin()
+        encoding = sys.stdin.encoding or 'utf-8'
+
+        while self.running:
+            line = await stdin.readline()
+            if not line:
+                # EOF
+                break
+
+            msg = line.decode(encoding, errors='replace').rstrip('\n')
+            try:
+                self.writer.write((msg + '\n').encode('utf-8'))
+                await self.writer.drain()
+            except OSError:
+                print('시스템> 서버와의 연결이 종료되었습니다.')
+                break
+
+            if msg == '/종료':
+                break
+
+    async def _pump_sock(self):
+        # 멀티바이트 문자가 두 번의 read 로 나뉘어 와도 깨지지 않도록 점진적으로 디코딩
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
         try:
             while self.running:
-                data = self.sock.recv(4096)
+                data = await self.reader.read(RECV_SIZE)
                 if not data:
                     print('시스템> 서버가 연결을 종료했습니다.')
-                    self.stop()
                     break
-                text = data.decode('utf-8', errors='ignore')
                 # 서버가 '닉네임을 입력하세요: '를 보낼 수 있으므로 그대로 출력
-                sys.stdout.write(text)
+                sys.stdout.write(decoder.decode(data))
                 sys.stdout.flush()
         except OSError:
             pass
-        finally:
-            self.running = False
+
+    async def _open_stdin(self):
+        """
+        표준입력을 이벤트 루프의 StreamReader 로 연결한다.
+        파이프면 connect_read_pipe 로 직접 감시하고,
+        터미널이거나 이를 쓸 수 없는 환경(윈도우 콘솔, 파일 리다이렉트)에서는 데몬 스레드가 줄 단위로 넣어 준다.
+        (connect_read_pipe 는 O_NONBLOCK 을 켜고 되돌리지 않는데, 터미널은 셸과 같은 파일 디스크립션을
+        공유하므로 종료 후 셸/다음 프로그램까지 논블로킹 입력을 물려받게 된다. 그래서 터미널에는 쓰지 않는다.)
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        if not sys.stdin.isatty():
+            try:
+                await loop.connect_read_pipe(
+                    lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+                )
+                return reader
+            except (NotImplementedError, ValueError, OSError):
+                pass
+
+        fd = sys.stdin.fileno()
+
+        def feed_lines():
+            # 종료 시 입력 대기 중인 스레드가 sys.stdin 버퍼 락을 잡고 있지 않도록 os.read 로 직접 읽는다.
+            # 줄 나누기는 StreamReader.readline 이 한다.
+            try:
+                for chunk in iter(lambda: os.read(fd, RECV_SIZE), b''):
+                    loop.call_soon_threadsafe(reader.feed_data, chunk)
+                loop.call_soon_threadsafe(reader.feed_eof)
+            except (RuntimeError, OSError):
+                # 이벤트 루프가 이미 닫힘 / 입력을 읽을 수 없음
+                pass
+
+        threading.Thread(target=feed_lines, daemon=True).start()
+        return reader
 
 
 def main():
@@ -1,221 +1,504 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import collections
+import os
+import re
+import selectors
 import socket
 import threading
 
 
-def send_whisper(sender_name, target_name, text, sockets_by_name, sender_sock):
+# recv 1회당 최대 수신 크기
+RECV_SIZE = 4096
+# 클라이언트 소켓의 커널 송수신 버퍼 크기(1 MiB). 느린 클라이언트에게 밀린 방송을 커널에 더 담아 둔다.
+SOCK_BUF_SIZE = 1 << 20
+# 귓속말 머리말. 메시지마다 다시 인코딩하지 않도록 미리 bytes 로 만들어 둔다.
+WHISPER_TAG = '(귓속말) '.encode('utf-8')
+# 귓속말 명령 머리말('/w ', '/whisper ', '/귓속말 ')을 한 번의 매칭으로 판별(수신 bytes 에 직접 적용)
+WHISPER_RE = re.compile(b'/(?:w|whisper|' + '귓속말'.encode('utf-8') + b') ', re.IGNORECASE)
+# 종료 명령
+QUIT_COMMAND = '/종료'.encode('utf-8')
+# 자주 보내는 안내 문구는 보낼 때마다 인코딩하지 않도록 미리 bytes 로 만들어 둔다.
+PROMPT_NICK = '닉네임을 입력하세요: '.encode('utf-8')
+PROMPT_BLANK = '닉네임은 공백일 수 없습니다. 다시 입력: '.encode('utf-8')
+PROMPT_DUP = '이미 사용 중인 닉네임입니다. 다른 닉네임을 입력: '.encode('utf-8')
+MSG_USAGE = '시스템> 사용법: /w 대상닉네임 메시지\n'.encode('utf-8')
+MSG_SEND_FAIL = '시스템> 전송 실패(상대 연결 상태를 확인하세요).\n'.encode('utf-8')
+# 닉네임(bytes)만 끼워 넣는 문구는 bytes 서식 문자열로 둔다.
+MSG_NOT_FOUND = '시스템> 닉네임 \'%s\' 사용자를 찾을 수 없습니다.\n'.encode('utf-8')
+MSG_JOIN = '%s님이 입장하셨습니다.\n'.encode('utf-8')
+MSG_LEAVE = '%s님이 퇴장하셨습니다.\n'.encode('utf-8')
+# sendmsg 1회에 넘길 수 있는 최대 버퍼 개수
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+# 뒤에 보낼 데이터가 더 있음을 커널에 알려 작은 세그먼트로 쪼개 보내지 않게 하는 플래그(리눅스 전용)
+MSG_MORE = getattr(socket, 'MSG_MORE', 0)
+# 윈도우 등 sendmsg 가 없는 플랫폼에서는 조각을 이어 붙여 send 로 보낸다.
+HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+
+def send_whisper(sender_name, target_name, text, client_by_name, sender, send):
     """
     귓속말 전송 함수(보너스 과제).
-    - sender_name: 보낸 사람 닉네임
+    - sender_name: 보낸 사람 닉네임 (UTF-8 bytes)
     - target_name: 받을 사람 닉네임
-    - text: 메시지 본문
-    - sockets_by_name: {닉네임: 소켓} 매핑
-    - sender_sock: 보낸 사람 소켓 (확인 메시지 전송용)
+    - text: 메시지 본문 (UTF-8 bytes, 디코딩하지 않고 그대로 전달)
+    - client_by_name: {닉네임: (워커, fd, ClientState)} 매핑
+    - sender: 보낸 사람 (워커, fd, ClientState) (확인 메시지 전송용)
+    - send: send((워커, fd, ClientState), payload) -> bool, 워커의 논블로킹 송신 함수
     """
-    
-    
-    target_sock = sockets_by_name.get(target_name)
-    if target_sock is None:
-        try:
-            sender_sock.sendall(
-                f'시스템> 닉네임 \'{target_name}\' 사용자를 찾을 수 없습니다.\n'.encode('utf-8')
-            )
-        except OSError:
-            pass
+    target_b = target_name.encode('utf-8')
+    target = client_by_name.get(target_name)
+    if target is None:
+        send(sender, MSG_NOT_FOUND % target_b)
         return
 
-    whisper_to_target = f'(귓속말) {sender_name}> {text}\n'
-    whisper_to_sender = f'(귓속말) {sender_name} -> {target_name}> {text}\n'
+    # 두 메시지는 미리 인코딩된 bytes 조각을 이어 붙여 만든다.
+    whisper_to_target = b''.join((WHISPER_TAG, sender_name, b'> ', text, b'\n'))
+    whisper_to_sender = b''.join(
+        (WHISPER_TAG, sender_name, b' -> ', target_b, b'> ', text, b'\n')
+    )
 
-    try:
-        target_sock.sendall(whisper_to_target.encode('utf-8'))
-    except OSError:
+    if not send(target, whisper_to_target):
         # 대상 전송 실패 시, 보낸 이에게만 알림
-        try:
-            sender_sock.sendall('시스템> 전송 실패(상대 연결 상태를 확인하세요).\n'.encode('utf-8'))
-        except OSError:
-            pass
+        send(sender, MSG_SEND_FAIL)
         return
 
-    try:
-        sender_sock.sendall(whisper_to_sender.encode('utf-8'))
-    except OSError:
-        pass
+    send(sender, whisper_to_sender)
+
+
+class ClientState:
+    """
+    연결 1개의 상태.
+    수신 버퍼(rxbuf)를 연결마다 한 번만 만들어 두고 recv_into 로 재사용해,
+    recv 할 때마다 4 KiB bytes 객체를 새로 할당하지 않는다.
+    메시지는 '\n' 단위로 끊어 처리하며, 아직 줄바꿈이 오지 않은 앞부분은
+    rxbuf 앞쪽(rxlen 바이트)에 남겨 두고 다음 수신에 이어 붙인다.
+    """
+
+    __slots__ = ('sock', 'name', 'name_b', 'rxbuf', 'rxview', 'rxlen', 'txq', 'want_write')
+
+    def __init__(self, sock):
+        self.sock = sock
+        # 닉네임 협상이 끝나기 전에는 None
+        self.name = None
+        # 방송 메시지 조립용으로 미리 인코딩해 둔 닉네임
+        self.name_b = None
+        self.rxbuf = bytearray(RECV_SIZE)
+        self.rxview = memoryview(self.rxbuf)
+        # rxbuf 에 남아 있는, 줄바꿈이 오지 않은 데이터 길이
+        self.rxlen = 0
+        # 아직 보내지 못한 송신 데이터 조각들(sendmsg 로 한 번에 보낸다)
+        self.txq = []
+        # 소켓 버퍼가 가득 차 쓰기 가능 이벤트를 기다리는 중인지 여부
+        self.want_write = False
+
+
+def make_listen_socket(host, port, reuseport=False):
+    """
+    논블로킹 수신 대기 소켓을 만든다.
+    reuseport=True 이면 SO_REUSEPORT 로 여러 소켓이 같은 포트를 공유하고,
+    커널이 새 연결을 소켓들에 나눠 준다.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM) # TCP 소켓 생성, IPv4/TCP 사용
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # 버퍼 크기는 수신 대기 소켓에 설정해 accept 된 소켓이 물려받게 한다.
+    # (연결 후 바꾸면 이미 협상된 TCP 윈도 스케일 때문에 수신 버퍼를 제대로 쓰지 못한다)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCK_BUF_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCK_BUF_SIZE)
+    if reuseport:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port)) # ip 소켓 포트에 바인딩
+    sock.listen(20) # 연결 대기열 생성. sock을 수신 대기 상태로 설정한다.
+    sock.setblocking(False) # 이벤트 루프가 멈추지 않도록 논블로킹으로 사용
+    return sock
 
 
 class ChatServer:
     """
-    멀티스레드 TCP 채팅 서버.
+    selectors 기반(리눅스 epoll, BSD/macOS kqueue, 그 밖에는 select) TCP 채팅 서버.
+    - 클라이언트마다 스레드를 만들지 않고, 워커(이벤트 루프)가 accept/recv/send 를 모두 처리
+    - workers > 1 이면 SO_REUSEPORT 로 워커마다 수신 대기 소켓을 따로 두고 CPU 코어에 고정
+      (CPython 에서는 GIL 때문에 연산이 병렬로 돌지는 않으므로 기본값은 1,
+      SO_REUSEPORT 가 없는 플랫폼에서는 워커 1개로 동작)
     - 접속 시 닉네임을 받아 전체 공지('~~님이 입장하셨습니다.') 방송
     - '/종료' 입력 시 연결 종료 처리 및 퇴장 방송
     - 일반 메시지는 '사용자> 메시지' 형식으로 전체 방송
     - 귓속말: '/w 대상닉 메시지...', '/whisper 대상닉 메시지...', '/귓속말 대상닉 메시지...'
     """
 
-    def __init__(self, host='0.0.0.0', port=5000):
+    def __init__(self, host='0.0.0.0', port=5000, workers=1):
         self.host = host
         self.port = port
 
-        self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM) # TCP 소켓 생성, IPv4/TCP 사용
-        self.server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_sock.bind((self.host, self.port)) # ip 소켓 포트에 바인딩
-        self.server_sock.listen(20) # 연결 대기열 생성. server_sock을 수신 대기 상태로 설정한다.
+        # 닉네임은 모든 워커에서 유일해야 하므로 입장/퇴장 때만 잡는 락으로 보호
+        self.names_lock = threading.Lock()
+        # 닉네임 -> (워커, fd, ClientState)
+        self.client_by_name = {}
 
-        # 동시성 보호용 락
-        self.clients_lock = threading.Lock()
-        # 소켓 -> 닉네임
-        self.name_by_sock = {}
-        # 닉네임 -> 소켓
-        self.sockets_by_name = {}
+        if workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+            print('시스템> SO_REUSEPORT 를 지원하지 않는 플랫폼이므로 워커 1개로 실행합니다.')
+            workers = 1
+        reuseport = workers > 1
+        self.workers = [
+            ChatWorker(self, i, make_listen_socket(host, port, reuseport=reuseport))
+            for i in range(workers)
+        ]
 
-        print(f'시스템> 서버 시작: {self.host}:{self.port}')
+        print(f'시스템> 서버 시작: {self.host}:{self.port} (워커 {workers}개)')
 
     def start(self):
+        pin = len(self.workers) > 1
+        threads = []
+        for worker in self.workers[1:]:
+            t = threading.Thread(target=worker.run, args=(pin,), daemon=True)
+            t.start()
+            threads.append(t)
+
         try:
-            while True:
-                client_sock, addr = self.server_sock.accept()
-                t = threading.Thread(
-                    target=self.handle_client,
-                    args=(client_sock, addr),
-                    daemon=True
-                )
-                t.start()
+            # 첫 번째 워커는 메인 스레드에서 돌려 Ctrl+C 를 받는다.
+            self.workers[0].run(pin)
         except KeyboardInterrupt:
             print('\n시스템> 서버 종료 중...')
         finally:
+            for worker in self.workers:
+                worker.stop()
+            for t in threads:
+                t.join(timeout=1.0)
             self.shutdown()
 
     def shutdown(self):
-        with self.clients_lock:
-            for s in list(self.name_by_sock.keys()):
-                try:
-                    s.close()
-                except OSError:
-                    pass
-            self.name_by_sock.clear()
-            self.sockets_by_name.clear()
-        try:
-            self.server_sock.close()
-        except OSError:
-            pass
+        for worker in self.workers:
+            worker.close()
+        with self.names_lock:
+            self.client_by_name.clear()
         print('시스템> 서버가 종료되었습니다.')
 
-    def handle_client(self, client_sock, addr):
-        try:
-            client_sock.sendall('닉네임을 입력하세요: '.encode('utf-8'))
-            name = self._negotiate_unique_name(client_sock)
-            if not name:
-                client_sock.close()
-                return
+    def broadcast(self, message, origin=None):
+        """
+        전체 클라이언트에게 메시지 방송.
+        origin 워커의 클라이언트에는 바로 보내고, 다른 워커에는 메시지함으로 넘긴다.
+        """
+        self.broadcast_payload((message + '\n').encode('utf-8'), origin)
 
-            with self.clients_lock:
-                self.name_by_sock[client_sock] = name
-                self.sockets_by_name[name] = client_sock
+    def broadcast_payload(self, payload, origin=None):
+        """
+        이미 인코딩된 payload(줄바꿈 포함)를 전체 클라이언트에게 방송.
+        """
+        for worker in self.workers:
+            if worker is origin:
+                worker.fan_out(payload)
+            else:
+                worker.post(('broadcast', payload))
 
-            self.broadcast(f'{name}님이 입장하셨습니다.')
+    def register_name(self, name, client):
+        """
+        닉네임을 등록한다. 이미 사용 중이면 False 반환.
+        """
+        with self.names_lock:
+            if name in self.client_by_name:
+                return False
+            self.client_by_name[name] = client
+            return True
 
-            while True:
-                data = client_sock.recv(4096)
-                if not data:
-                    # 소켓 정상 종료
-                    break
+    def unregister_name(self, name):
+        with self.names_lock:
+            self.client_by_name.pop(name, None)
 
-                msg = data.decode('utf-8', errors='ignore').strip()
-                if not msg:
-                    continue
 
-                if msg == '/종료':
-                    # 클라이언트 종료 요청
-                    break
+class ChatWorker:
+    """
+    수신 대기 소켓 1개와 셀렉터 1개를 가진 단일 스레드 이벤트 루프.
+    자신이 accept 한 클라이언트만 직접 다루며, 다른 워커로 가는 송신은
+    메시지함(inbox)에 넣고 깨우기용 소켓으로 알린다.
+    """
 
-                if self._is_whisper_command(msg):
-                    target, text = self._parse_whisper(msg)
-                    if target and text:
-                        send_whisper(
-                            sender_name=name,
-                            target_name=target,
-                            text=text,
-                            sockets_by_name=self.sockets_by_name,
-                            sender_sock=client_sock
-                        )
-                    else:
-                        try:
-                            client_sock.sendall(
-                                '시스템> 사용법: /w 대상닉네임 메시지\n'.encode('utf-8')
-                            )
-                        except OSError:
-                            pass
+    def __init__(self, server, index, listen_sock):
+        self.server = server
+        self.index = index
+        self.listen_sock = listen_sock
+        self.running = False
+
+        # 수신 대기 소켓과 모든 클라이언트 소켓을 하나의 셀렉터에 등록해 감시한다.
+        # DefaultSelector 는 플랫폼에서 가장 효율적인 구현(epoll/kqueue/...)을 고른다.
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listen_sock, selectors.EVENT_READ)
+
+        # 다른 스레드가 넣는 메시지함. deque.append/popleft 는 스레드 세이프하다.
+        self.inbox = collections.deque()
+        self.wake_r, self.wake_w = socket.socketpair()
+        self.wake_r.setblocking(False)
+        self.wake_w.setblocking(False)
+        self.selector.register(self.wake_r, selectors.EVENT_READ)
+
+        # fd -> ClientState
+        self.clients = {}
+        # 닉네임이 정해진 클라이언트 (fd, ClientState) 묶음.
+        # 입장/퇴장 때만 새 튜플로 바꿔 끼우고, 방송은 복사 없이 그대로 순회한다.
+        self.members = ()
+        # 이번 이벤트 묶음에서 송신 큐가 새로 생긴 fd 목록
+        self.dirty = []
+
+    def run(self, pin=False):
+        if pin:
+            self._pin_to_cpu()
+
+        listen_fd = self.listen_sock.fileno()
+        wake_fd = self.wake_r.fileno()
+        self.running = True
+        while self.running:
+            for key, events in self.selector.select():
+                fd = key.fd
+                if fd == listen_fd:
+                    self._accept_ready()
+                    continue
+                if fd == wake_fd:
+                    self._drain_inbox()
                     continue
+                if events & selectors.EVENT_WRITE:
+                    self._flush(fd)
+                if events & selectors.EVENT_READ:
+                    self._recv_ready(fd)
+            # 이벤트 묶음 처리 중 쌓인 송신은 연결마다 한 번의 sendmsg 로 내보낸다.
+            self._flush_dirty()
+
+    def stop(self):
+        self.running = False
+        self._wake()
+
+    def close(self):
+        for state in list(self.clients.values()):
+            try:
+                state.sock.close()
+            except OSError:
+                pass
+        self.clients.clear()
+        self.members = ()
+        for s in (self.listen_sock, self.wake_r, self.wake_w):
+            try:
+                s.close()
+            except OSError:
+                pass
+        try:
+            self.selector.close()
+        except OSError:
+            pass
 
-                # 일반 메시지 방송
-                self.broadcast(f'{name}> {msg}')
+    def post(self, item):
+        """
+        다른 스레드에서 이 워커에게 일을 넘긴다.
+        """
+        self.inbox.append(item)
+        self._wake()
 
-        except ConnectionResetError:
-            # 강제 종료
+    def fan_out(self, payload):
+        """
+        이 워커가 가진 클라이언트 전체에게 payload 전송.
+        """
+        # 큐에 넣기만 하므로 순회 중에 members 가 바뀌지 않는다(_send 를 풀어 쓴 것).
+        dirty = self.dirty
+        for fd, state in self.members:
+            if not state.txq:
+                dirty.append(fd)
+            state.txq.append(payload)
+
+    def send_to(self, client, payload):
+        """
+        (워커, fd, ClientState) 로 지정된 클라이언트에게 전송. 다른 워커 소속이면 메시지함으로 넘긴다.
+        fd 번호는 퇴장 후 새 연결에 다시 쓰일 수 있으므로 ClientState 가 같을 때만 보낸다.
+        """
+        worker, fd, state = client
+        if worker is self:
+            if self.clients.get(fd) is not state:
+                return False
+            return self._send(fd, payload)
+        worker.post(('send', fd, state, payload))
+        return True
+
+    def _pin_to_cpu(self):
+        """
+        워커 스레드를 CPU 코어 하나에 고정한다(리눅스 전용, 실패해도 무시).
+        """
+        if not hasattr(os, 'sched_setaffinity'):
+            return
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cpus[self.index % len(cpus)]})
+        except OSError:
             pass
-        finally:
-            # 정리 및 퇴장 방송
-            self._remove_client(client_sock)
 
-    def broadcast(self, message):
+    def _wake(self):
+        try:
+            self.wake_w.send(b'\0')
+        except (BlockingIOError, InterruptedError):
+            # 이미 깨우기 신호가 충분히 쌓여 있음
+            pass
+        except OSError:
+            pass
+
+    def _drain_inbox(self):
+        try:
+            while self.wake_r.recv(RECV_SIZE):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            pass
+
+        while self.inbox:
+            item = self.inbox.popleft()
+            if item[0] == 'broadcast':
+                self.fan_out(item[1])
+            else:
+                _, fd, state, payload = item
+                # 넘어오는 사이 퇴장한 연결이면 버린다(같은 fd 를 받은 새 연결에 보내지 않는다).
+                if self.clients.get(fd) is state:
+                    self._send(fd, payload)
+
+    def _accept_ready(self):
         """
-        전체 클라이언트에게 메시지 방송.
+        대기열에 쌓인 연결을 한 번에 모두 수락한다.
         """
-        payload = (message + '\n').encode('utf-8')
-        with self.clients_lock:
-            dead_sockets = []
-            for s in self.name_by_sock.keys():
-                try:
-                    s.sendall(payload)
-                except OSError:
-                    dead_sockets.append(s)
+        while True:
+            try:
+                client_sock, _addr = self.listen_sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
 
-            for s in dead_sockets:
-                self._unsafe_remove(s)
+            client_sock.setblocking(False)
+            # 짧은 채팅 줄이 Nagle 알고리즘 때문에 지연되지 않도록 바로 전송
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            fd = client_sock.fileno()
+            self.clients[fd] = ClientState(client_sock)
+            self.selector.register(client_sock, selectors.EVENT_READ)
+            self._send(fd, PROMPT_NICK)
 
-    def _negotiate_unique_name(self, client_sock):
+    def _recv_ready(self, fd):
         """
-        중복되지 않는 닉네임을 받을 때까지 요청한다.
-        연결이 끊기면 None 반환.
+        읽기 가능해진 클라이언트 소켓에서 한 번 수신해,
+        완성된 줄('\n' 으로 끝나는 메시지)마다 상태에 맞게 처리한다.
         """
+        state = self.clients.get(fd)
+        if state is None:
+            # 같은 이벤트 묶음 안에서 이미 정리된 연결
+            return
+
+        try:
+            n = state.sock.recv_into(state.rxview[state.rxlen:])
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            # ConnectionResetError 등 강제 종료
+            n = 0
+
+        if not n:
+            # 소켓 정상 종료
+            self._remove_client(fd)
+            return
+
+        end = state.rxlen + n
+        start = 0
         while True:
-            data = client_sock.recv(4096)
-            if not data:
-                return None
-            name = data.decode('utf-8', errors='ignore').strip()
-            if not name:
-                try:
-                    client_sock.sendall('닉네임은 공백일 수 없습니다. 다시 입력: '.encode('utf-8'))
-                except OSError:
-                    return None
-                continue
-
-            with self.clients_lock:
-                if name in self.sockets_by_name:
-                    try:
-                        client_sock.sendall(
-                            '이미 사용 중인 닉네임입니다. 다른 닉네임을 입력: '.encode('utf-8')
-                        )
-                    except OSError:
-                        return None
-                    continue
-                return name
+            nl = state.rxbuf.find(b'\n', start, end)
+            if nl < 0:
+                if start == 0 and end == len(state.rxbuf):
+                    # 버퍼를 가득 채우도록 줄바꿈이 없으면 그때까지를 메시지 하나로 본다.
+                    nl = end
+                else:
+                    break
+            self._handle_line(fd, state, state.rxview[start:nl])
+            start = nl + 1
+            if self.clients.get(fd) is not state:
+                # '/종료' 등으로 처리 도중 연결이 정리됨
+                return
+            if start >= end:
+                break
+
+        # 줄바꿈이 오지 않은 나머지는 버퍼 앞으로 옮겨 다음 수신에 이어 붙인다.
+        rest = max(end - start, 0)
+        if rest and start:
+            state.rxview[:rest] = state.rxview[start:end]
+        state.rxlen = rest
+
+    def _handle_line(self, fd, state, line):
+        """
+        수신 버퍼에서 잘라낸 한 줄(memoryview)을 상태에 맞게 처리한다.
+        """
+        if state.name is not None:
+            # 일반 메시지는 디코딩하지 않고 bytes 그대로 파싱/방송한다.
+            self.handle_client(fd, state, line.tobytes())
+        else:
+            # 닉네임은 문자열 키로 쓰므로 재사용 버퍼에서 바로 디코딩
+            self._negotiate_unique_name(fd, state, str(line, 'utf-8', 'ignore'))
+
+    def handle_client(self, fd, state, data):
+        """
+        닉네임이 정해진 클라이언트가 보낸 메시지 1건(bytes)을 처리한다.
+        """
+        msg = data.strip()
+        if not msg:
+            return
+
+        if msg == QUIT_COMMAND:
+            # 클라이언트 종료 요청
+            self._remove_client(fd)
+            return
+
+        if self._is_whisper_command(msg):
+            target, text = self._parse_whisper(msg)
+            if target and text:
+                send_whisper(
+                    sender_name=state.name_b,
+                    target_name=target,
+                    text=text,
+                    client_by_name=self.server.client_by_name,
+                    sender=(self, fd, state),
+                    send=self.send_to
+                )
+            else:
+                self._send(fd, MSG_USAGE)
+            return
+
+        # 일반 메시지 방송
+        self.server.broadcast_payload(b''.join((state.name_b, b'> ', msg, b'\n')), origin=self)
+
+    def _negotiate_unique_name(self, fd, state, text):
+        """
+        중복되지 않는 닉네임이 들어오면 등록하고 입장을 방송한다.
+        공백/중복이면 다시 입력을 요청한다.
+        """
+        name = text.strip()
+        if not name:
+            self._send(fd, PROMPT_BLANK)
+            return
+
+        if not self.server.register_name(name, (self, fd, state)):
+            self._send(fd, PROMPT_DUP)
+            return
+
+        state.name = name
+        state.name_b = name.encode('utf-8')
+        self.members = self.members + ((fd, state),)
+        self.server.broadcast_payload(MSG_JOIN % state.name_b, origin=self)
 
     def _is_whisper_command(self, msg):
         """
         귓속말 명령 여부 판단.
         """
-        lowered = msg.lower()
-        return lowered.startswith('/w ') or lowered.startswith('/whisper ') or lowered.startswith('/귓속말 ')
+        # 전체 문자열을 lower() 하지 않고 앞부분만 검사한다.
+        return WHISPER_RE.match(msg) is not None
 
     def _parse_whisper(self, msg):
         """
-        귓속말 파싱: '/w 대상닉 메시지...' 형태.
-        반환: (대상닉, 메시지본문) 혹은 (None, None)
+        귓속말 파싱: '/w 대상닉 메시지...' 형태의 bytes.
+        반환: (대상닉 str, 메시지본문 bytes) 혹은 (None, None)
         """
-        parts = msg.split(' ', 2)
+        parts = msg.split(b' ', 2)
         if len(parts) < 3:
             return None, None
         # parts[0] = '/w' or '/whisper' or '/귓속말'
@@ -223,33 +506,115 @@ class ChatServer:
         text = parts[2].strip()
         if not target or not text:
             return None, None
-        return target, text
+        # 닉네임 조회에 쓰는 대상만 디코딩하고, 본문은 bytes 그대로 둔다.
+        return target.decode('utf-8', errors='ignore'), text
 
-    def _remove_client(self, client_sock):
+    def _send(self, fd, payload):
+        """
+        송신 큐에 payload 를 넣는다. 실제 전송은 이벤트 묶음 처리가 끝난 뒤
+        _flush_dirty 에서 연결마다 sendmsg 한 번으로 몰아서 한다.
+        연결이 이미 없으면 False 반환.
+        """
+        state = self.clients.get(fd)
+        if state is None:
+            return False
+
+        if not state.txq:
+            self.dirty.append(fd)
+        state.txq.append(payload)
+        return True
+
+    def _flush_dirty(self):
+        """
+        송신 큐가 생긴 연결들을 한 번씩 비운다.
+        쓰기 가능 이벤트를 기다리는 연결은 이벤트가 올 때 _flush 에서 처리된다.
+        """
+        if not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, []
+        for fd in dirty:
+            state = self.clients.get(fd)
+            if state is not None and not state.want_write:
+                self._flush(fd)
+
+    def _flush(self, fd):
+        """
+        송신 큐를 sendmsg(벡터 I/O)로 보낸다. 소켓 버퍼가 가득 차면
+        남은 조각은 그대로 두고 쓰기 가능 이벤트에서 이어서 보낸다.
+        """
+        state = self.clients.get(fd)
+        if state is None:
+            return
+
+        txq = state.txq
+        while txq:
+            batch = txq[:IOV_MAX]
+            # 큐가 IOV_MAX 보다 길면 이어지는 sendmsg 가 있으므로 MSG_MORE 로 묶어 보낸다.
+            flags = MSG_MORE if len(txq) > IOV_MAX else 0
+            try:
+                if HAS_SENDMSG:
+                    sent = state.sock.sendmsg(batch, (), flags)
+                else:
+                    sent = state.sock.send(b''.join(batch))
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._unsafe_remove(fd)
+                return
+
+            # 다 보낸 조각은 버리고, 일부만 보낸 조각은 남은 부분만 가리키게 한다.
+            done = 0
+            for chunk in batch:
+                if sent < len(chunk):
+                    break
+                sent -= len(chunk)
+                done += 1
+            del txq[:done]
+            if sent:
+                txq[0] = memoryview(txq[0])[sent:]
+                break
+            if done < len(batch):
+                break
+
+        if txq and not state.want_write:
+            state.want_write = True
+            self.selector.modify(state.sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        elif not txq and state.want_write:
+            state.want_write = False
+            self.selector.modify(state.sock, selectors.EVENT_READ)
+
+    def _remove_client(self, fd):
         """
         클라이언트 퇴장 처리 및 방송.
         """
-        name = None
-        with self.clients_lock:
-            name = self.name_by_sock.get(client_sock)
-            self._unsafe_remove(client_sock)
+        state = self.clients.get(fd)
+        name_b = state.name_b if state is not None else None
+        self._unsafe_remove(fd)
+
+        if name_b:
+            self.server.broadcast_payload(MSG_LEAVE % name_b, origin=self)
 
-        if name:
-            self.broadcast(f'{name}님이 퇴장하셨습니다.')
+    def _unsafe_remove(self, fd):
+        """
+        퇴장 방송 없이 내부 맵/셀렉터에서 연결을 제거하고 소켓을 닫는다.
+        이 워커의 스레드에서만 호출한다.
+        """
+        state = self.clients.pop(fd, None)
+        if state is None:
+            return
+        if state.name is not None:
+            self.server.unregister_name(state.name)
+            self.members = tuple(m for m in self.members if m[1] is not state)
 
         try:
-            client_sock.close()
+            self.selector.unregister(state.sock)
+        except (KeyError, OSError, ValueError):
+            pass
+        try:
+            state.sock.close()
         except OSError:
             pass
 
-    def _unsafe_remove(self, client_sock):
-        """
-        락이 잡힌 상태에서만 호출. 내부 맵에서 소켓 제거.
-        """
-        name = self.name_by_sock.pop(client_sock, None)
-        if name is not None:
-            self.sockets_by_name.pop(name, None)
-
 
 def main():
     server = ChatServer(host='0.0.0.0', port=5000)
@@ -1,12 +1,21 @@
 # domain/question/question_router.py
-from typing import Any, Dict, List
-
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from database import get_db
 from models import Question
 
+# 질문 목록 조회 구문. lambda_stmt 로 구문 객체와 캐시 키를 한 번만 만들고,
+# 요청마다 limit/offset 만 바인드 파라미터로 넘겨 컴파일된 SQL 을 재사용한다.
+QUESTION_LIST_STMT = lambda_stmt(
+    lambda: select(Question.id, Question.subject, Question.content, Question.create_date)
+    .order_by(Question.create_date.desc())
+    .limit(bindparam('limit'))
+    .offset(bindparam('offset'))
+)
+
 router = APIRouter(
     prefix='/api/question',
     tags=['question'],
@@ -14,28 +23,23 @@ router = APIRouter(
 
 
 @router.get('/question-list', summary='질문 목록 조회')
-def question_list(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+def question_list(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+) -> Response:
     """
     질문 목록을 조회한다.
 
-    - SQLite(board.db)에 저장된 question 테이블에서 모든 레코드를 조회한다.
-    - ORM(Question 모델)을 이용해서 데이터를 가져온다.
-    - 결과는 JSON 배열 형태로 반환한다.
+    - SQLite(board.db)에 저장된 question 테이블에서 최신순으로 limit/offset 만큼 조회한다.
+    - ORM(Question 모델)의 컬럼만 select 해서 객체 생성 없이 Row로 가져온다.
+    - 결과는 orjson으로 바로 직렬화해 JSON 배열 형태로 반환한다.
     """
-    questions = (
-        db.query(Question)
-        .order_by(Question.create_date.desc())
-        .all()
+    rows = db.execute(
+        QUESTION_LIST_STMT,
+        {'limit': limit, 'offset': offset},
+    ).mappings().all()
+    return Response(
+        orjson.dumps([dict(row) for row in rows]),
+        media_type='application/json',
     )
-
-    result: List[Dict[str, Any]] = []
-    for question in questions:
-        result.append(
-            {
-                'id': question.id,
-                'subject': question.subject,
-                'content': question.content,
-                'create_date': question.create_date,
-            },
-        )
-    return result
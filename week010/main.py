@@ -2,8 +2,9 @@
 from datetime import datetime
 
 from fastapi import FastAPI
+from sqlalchemy import insert
 
-from database import Base, SessionLocal, engine
+from database import Base, engine
 from domain.question.question_router import router as question_router
 from models import Question
 
@@ -28,19 +29,17 @@ def create_sample_question() -> None:
     초기 테스트용 질문 1개를 DB에 넣는 유틸 함수입니다.
     main.py를 직접 실행했을 때만 동작합니다.
     """
-    db = SessionLocal()
-    try:
-        q = Question(
-            subject='첫 번째 질문',
-            content='ORM과 Alembic으로 만든 첫 질문입니다.',
-            create_date=datetime.utcnow(),
+    # 세션(identity map, flush)을 거치지 않고 Core insert 로 바로 넣습니다.
+    # 여러 건을 넣을 때는 values 대신 dict 리스트를 execute 에 넘기면 됩니다.
+    with engine.begin() as conn:
+        result = conn.execute(
+            insert(Question).values(
+                subject='첫 번째 질문',
+                content='ORM과 Alembic으로 만든 첫 질문입니다.',
+                create_date=datetime.utcnow(),
+            )
         )
-        db.add(q)
-        db.commit()
-        db.refresh(q)
-        print('생성된 Question ID:', q.id)
-    finally:
-        db.close()
+    print('생성된 Question ID:', result.inserted_primary_key[0])
 
 
 if __name__ == '__main__':
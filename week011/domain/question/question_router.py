@@ -1,13 +1,24 @@
 # domain/question/question_router.py
 from typing import List
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from database import get_db
 from models import Question
 from .question_schema import QuestionSchema
 
+# 질문 목록 조회 구문. lambda_stmt 로 구문 객체와 캐시 키를 한 번만 만들고,
+# 요청마다 limit/offset 만 바인드 파라미터로 넘겨 컴파일된 SQL 을 재사용합니다.
+QUESTION_LIST_STMT = lambda_stmt(
+    lambda: select(Question.id, Question.subject, Question.content, Question.create_date)
+    .order_by(Question.create_date.desc())
+    .limit(bindparam('limit'))
+    .offset(bindparam('offset'))
+)
+
 router = APIRouter(
     prefix='/api/question',
     tags=['question'],
@@ -16,21 +27,28 @@ router = APIRouter(
 
 @router.get(
     '/',
-    response_model=List[QuestionSchema],
+    # 행마다 Pydantic 검증을 거치지 않도록 response_model 대신 문서화용으로만 스키마를 지정
+    responses={200: {'model': List[QuestionSchema]}},
     summary='질문 목록 조회',
 )
-def question_list(db: Session = Depends(get_db)) -> List[Question]:
+def question_list(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+) -> Response:
     """
     질문 목록을 조회합니다.
 
     - contextlib 기반 get_db_cm()을 감싼 get_db 의존성을 통해
       요청마다 DB 세션을 주입받습니다.
-    - SQLAlchemy ORM(Question 모델)을 이용해 question 테이블 전체를 조회합니다.
-    - Pydantic QuestionSchema (orm_mode=True)를 통해 응답 JSON을 생성합니다.
+    - SQLAlchemy ORM(Question 모델)의 컬럼만 select 하여 최신순으로 limit/offset 만큼 조회합니다.
+    - 조회한 Row를 orjson으로 바로 직렬화해 응답 JSON을 생성합니다.
     """
-    questions = (
-        db.query(Question)
-        .order_by(Question.create_date.desc())
-        .all()
+    rows = db.execute(
+        QUESTION_LIST_STMT,
+        {'limit': limit, 'offset': offset},
+    ).mappings().all()
+    return Response(
+        orjson.dumps([dict(row) for row in rows]),
+        media_type='application/json',
     )
-    return questions
@@ -0,0 +1,80 @@
+# domain/question/question_crud.py
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import insert
+
+from database import engine
+from models import Question
+
+# 한 번의 커밋(트랜잭션)으로 묶을 최대 질문 수
+WRITE_BATCH_SIZE = 64
+# 첫 등록 요청 이후 같은 배치에 합류할 요청을 기다리는 최대 시간(초)
+WRITE_BATCH_WAIT = 0.001
+
+# (저장할 행, 결과를 돌려줄 Future) 를 담는 쓰기 큐
+_write_queue = queue.Queue()
+
+
+def create_question(subject: str, content: str) -> Dict[str, Any]:
+    """
+    질문 1건을 쓰기 큐에 넣고, 백그라운드 writer가 커밋할 때까지 기다린 뒤
+    저장된 행을 dict로 반환합니다.
+
+    - 동시에 들어온 등록 요청들은 한 트랜잭션으로 묶여 커밋되므로,
+      요청마다 커밋(fsync)하던 비용을 여러 요청이 나눠 냅니다.
+    - 커밋이 끝난 뒤에만 반환하므로 응답을 받은 질문은 항상 DB에 저장되어 있습니다.
+    """
+    row = {
+        'subject': subject,
+        'content': content,
+        'create_date': datetime.utcnow(),
+    }
+    future: Future = Future()
+    _write_queue.put((row, future))
+    return {'id': future.result(), **row}
+
+
+def _writer_loop() -> None:
+    """
+    쓰기 큐에서 최대 WRITE_BATCH_SIZE 건을 모아 한 번에 커밋하는 백그라운드 루프입니다.
+    """
+    while True:
+        batch = [_write_queue.get()]
+        deadline = time.monotonic() + WRITE_BATCH_WAIT
+        while len(batch) < WRITE_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_write_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        _write_batch(batch)
+
+
+def _write_batch(batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+    """
+    배치의 모든 행을 하나의 트랜잭션으로 INSERT 하고,
+    각 요청의 Future에 생성된 id(실패 시 예외)를 전달합니다.
+    """
+    try:
+        with engine.begin() as conn:
+            ids = [
+                conn.execute(insert(Question).values(**row)).inserted_primary_key[0]
+                for row, _ in batch
+            ]
+    except Exception as exc:
+        for _, future in batch:
+            future.set_exception(exc)
+        return
+
+    for (_, future), question_id in zip(batch, ids):
+        future.set_result(question_id)
+
+
+threading.Thread(target=_writer_loop, name='question-writer', daemon=True).start()
@@ -1,83 +1,36 @@
 # domain/question/question_router.py
-from datetime import datetime
-from typing import List
+from typing import Any, List
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
 from fastapi.responses import HTMLResponse
+from sqlalchemy import bindparam, func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from database import get_db
 from models import Question
+from . import question_crud
 from .question_schema import QuestionSchema, QuestionCreate
 
-router = APIRouter(
-    prefix='/api/question',
-    tags=['question'],
-)
-
-
-@router.get(
-    '/',
-    response_model=List[QuestionSchema],
-    summary='질문 목록 조회',
-)
-def question_list(db: Session = Depends(get_db)) -> List[Question]:
-    """
-    질문 목록을 조회합니다.
-
-    - contextlib 기반 get_db_cm()을 감싼 get_db 의존성을 통해
-      요청마다 DB 세션을 주입받습니다.
-    - SQLAlchemy ORM(Question 모델)을 이용해 question 테이블 전체를 조회합니다.
-    - Pydantic QuestionSchema (orm_mode=True)를 통해 응답 JSON을 생성합니다.
-    """
-    questions = (
-        db.query(Question)
-        .order_by(Question.create_date.desc())
-        .all()
+# 질문 목록 조회 구문. lambda_stmt 로 구문 객체와 캐시 키를 한 번만 만들고,
+# 요청마다 limit/offset 만 바인드 파라미터로 넘겨 컴파일된 SQL 을 재사용합니다.
+# create_date 는 SQLite 에 'YYYY-MM-DD HH:MM:SS.ffffff' 문자열로 저장되어 있으므로,
+# 행마다 datetime 으로 파싱했다가 다시 문자열로 직렬화하지 않고
+# SQL 에서 바로 ISO 8601 형식('T' 구분자)으로 바꿔 가져옵니다.
+QUESTION_LIST_STMT = lambda_stmt(
+    lambda: select(
+        Question.id,
+        Question.subject,
+        Question.content,
+        func.replace(Question.create_date, ' ', 'T').label('create_date'),
     )
-    return questions
-
-
-@router.post(
-    '/',
-    response_model=QuestionSchema,
-    summary='질문 등록',
-    status_code=201,
+    .order_by(Question.create_date.desc())
+    .limit(bindparam('limit'))
+    .offset(bindparam('offset'))
 )
-def question_create(
-    question_in: QuestionCreate,
-    db: Session = Depends(get_db),
-) -> Question:
-    """
-    새로운 질문을 등록합니다.
 
-    - 요청 본문은 QuestionCreate 스키마(subject, content 사용)를 따릅니다.
-    - 제목과 내용은 빈 문자열을 허용하지 않습니다(min_length=1).
-    - SQLAlchemy ORM(Question 모델)을 이용해 SQLite(board.db)에 저장합니다.
-    - 저장 후 커밋하고, 생성된 Question 객체를 반환합니다.
-    """
-    question = Question(
-        subject=question_in.subject,
-        content=question_in.content,
-        create_date=datetime.utcnow(),
-    )
-    db.add(question)
-    db.commit()
-    db.refresh(question)
-    return question
-
-
-@router.get(
-    '/form',
-    response_class=HTMLResponse,
-    summary='질문 등록 폼 페이지',
-)
-def question_form() -> str:
-    """
-    질문 등록을 위한 간단한 HTML 폼을 반환합니다.
-    - 같은 도메인(/api/question/)으로 POST 요청을 보내므로 CORS 문제가 없습니다.
-    """
-    return """
+# 질문 등록 폼 페이지. 요청마다 문자열을 인코딩하지 않도록 import 시점에 bytes 로 만들어 둡니다.
+QUESTION_FORM_HTML = """
     <!DOCTYPE html>
     <html lang="ko">
     <head>
@@ -132,4 +85,84 @@ def question_form() -> str:
         </script>
     </body>
     </html>
+""".encode('utf-8')
+# 폼 페이지는 바뀌지 않으므로 1시간 동안 캐시해도 됩니다.
+QUESTION_FORM_HEADERS = {'Cache-Control': 'public, max-age=3600'}
+
+router = APIRouter(
+    prefix='/api/question',
+    tags=['question'],
+)
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    DB에서 읽었거나 방금 저장한 값은 다시 Pydantic 검증을 거치지 않고
+    orjson으로 바로 직렬화해 JSON 응답으로 반환합니다.
+    """
+    return Response(
+        orjson.dumps(content),
+        status_code=status_code,
+        media_type='application/json',
+    )
+
+
+@router.get(
+    '/',
+    # 행마다 Pydantic 검증을 거치지 않도록 response_model 대신 문서화용으로만 스키마를 지정
+    responses={200: {'model': List[QuestionSchema]}},
+    summary='질문 목록 조회',
+)
+def question_list(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    질문 목록을 조회합니다.
+
+    - contextlib 기반 get_db_cm()을 감싼 get_db 의존성을 통해
+      요청마다 DB 세션을 주입받습니다.
+    - SQLAlchemy ORM(Question 모델)의 컬럼만 select 하여 최신순으로 limit/offset 만큼 조회합니다.
+    - 조회한 Row를 orjson으로 바로 직렬화해 응답 JSON을 생성합니다.
+    """
+    rows = db.execute(
+        QUESTION_LIST_STMT,
+        {'limit': limit, 'offset': offset},
+    ).mappings().all()
+    return _json_response([dict(row) for row in rows])
+
+
+@router.post(
+    '/',
+    # 입력은 QuestionCreate로 검증하고, 방금 저장한 행은 다시 검증하지 않도록 스키마는 문서화용으로만 지정
+    responses={201: {'model': QuestionSchema}},
+    summary='질문 등록',
+    status_code=201,
+)
+def question_create(question_in: QuestionCreate) -> Response:
+    """
+    새로운 질문을 등록합니다.
+
+    - 요청 본문은 QuestionCreate 스키마(subject, content 사용)를 따릅니다.
+    - 제목과 내용은 빈 문자열을 허용하지 않습니다(min_length=1).
+    - question_crud의 백그라운드 writer가 동시에 들어온 등록 요청을
+      한 트랜잭션으로 묶어 SQLite(board.db)에 저장합니다.
+    - 커밋이 끝난 뒤 생성된 질문을 반환합니다.
+    """
+    question = question_crud.create_question(question_in.subject, question_in.content)
+    return _json_response(question, status_code=201)
+
+
+@router.get(
+    '/form',
+    response_class=HTMLResponse,
+    summary='질문 등록 폼 페이지',
+)
+def question_form() -> HTMLResponse:
+    """
+    질문 등록을 위한 간단한 HTML 폼을 반환합니다.
+    - 같은 도메인(/api/question/)으로 POST 요청을 보내므로 CORS 문제가 없습니다.
+    - 미리 인코딩해 둔 QUESTION_FORM_HTML 을 그대로 보내고, 브라우저/프록시가 캐시하도록 합니다.
     """
+    return HTMLResponse(QUESTION_FORM_HTML, headers=QUESTION_FORM_HEADERS)
@@ -1,7 +1,7 @@
 # domain/question/question_schema.py
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QuestionSchema(BaseModel):
@@ -10,11 +10,10 @@ class QuestionSchema(BaseModel):
     content: str
     create_date: datetime
 
-    class Config:
-        # orm_mode 를 True 로 설정하면 SQLAlchemy 모델 인스턴스를
-        # 그대로 반환해도 해당 객체의 속성에서 값을 읽어와서
-        # Pydantic 스키마로 변환해 준다.
-        orm_mode = True
+    # from_attributes 를 True 로 설정하면(pydantic v1 의 orm_mode) SQLAlchemy 모델 인스턴스를
+    # 그대로 반환해도 해당 객체의 속성에서 값을 읽어와서
+    # Pydantic 스키마로 변환해 준다.
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuestionCreate(BaseModel):
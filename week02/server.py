@@ -15,24 +15,36 @@ aws를 이용해 구현된 순수한 html 및 지오네이션 확인 목적의 
 - POST 등 비허용 메서드: 405 Method Not Allowed (+ Allow 헤더)
 - HEAD: 헤더만 200 반환
 - 매 요청마다 접속 시간/클라이언트 IP(선택: 경로, UA, 위치정보) 콘솔 로그
-- 공인 IP면 간단 지오로케이션(ip-api.com) 시도(표준 urllib/json)
+  (지오로케이션과 로그 기록은 백그라운드 로그 스레드가 처리해 응답을 지연시키지 않음)
+- 공인 IP면 간단 지오로케이션(ip-api.com) 시도(표준 http.client/json, keep-alive 연결 재사용)
 - 프록시/터널 환경에서 X-Forwarded-For / X-Real-IP / CF-Connecting-IP 지원
 - 멀티스레드 처리(ThreadingHTTPServer)
+- 멀티프로세스: SO_REUSEPORT 로 CPU 코어 수만큼(WORKERS 환경변수로 조정) 워커 프로세스가 같은 포트를 나눠 받음
 - 지오로케이션/접속 로그를 NDJSON(줄당 JSON) 형태로 geo_access.log파일에 json 형식으로 누적 저장
 """
 
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
-from datetime import datetime
+import http.client
 from ipaddress import ip_address
-from urllib.request import urlopen, Request
 from urllib.parse import quote
-from typing import Optional, Dict
+from email.utils import formatdate
+from typing import Optional, Dict, Iterable, List, Tuple
+from collections import OrderedDict
 from functools import lru_cache
 import json
 import os
+import queue
 import sys
 import socket
-import logging
+import signal
+import threading
+import time
+
+try:
+    # 설치되어 있으면 로그 줄 직렬화에 orjson 사용(C 구현, bytes 로 바로 출력)
+    import orjson
+except ImportError:
+    orjson = None
 
 
 DEFAULT_HOST = '0.0.0.0'
@@ -40,30 +52,107 @@ DEFAULT_PORT = 8080
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INDEX_FILE = os.path.join(BASE_DIR, 'index.html')
 READ_BUFFER_SIZE = 64 * 1024  # 64 KiB
+WRITE_BUFFER_SIZE = 64 * 1024  # 64 KiB, 헤더와 본문을 모아 한 번에 send
+SEND_BUFFER_SIZE = 256 * 1024  # 256 KiB, 응답 소켓의 커널 송신 버퍼
+INDEX_CACHE_MAX_SIZE = 1024 * 1024  # 1 MiB 이하 index.html 만 메모리에 캐시(더 크면 sendfile)
+
+# index.html 캐시: ((경로, mtime_ns, 크기), 본문). 튜플째 교체하므로 읽을 때는 락이 필요 없다.
+_INDEX_CACHE = (None, b'')
+_INDEX_LOCK = threading.Lock()
 
-# 로그 파일 설정(표준 라이브러리 logging, 스레드 세이프)
+# 로그 파일 설정
 LOG_DIR = os.path.join(BASE_DIR, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.environ.get('GEO_LOG_FILE', os.path.join(LOG_DIR, 'geo_access.log'))
 
-GEO_LOGGER = logging.getLogger('geo_logger')
+# 로그 파일은 로그 스레드만 쓰므로 logging 핸들러(레코드마다 락 + write) 대신
+# O_APPEND 로 한 번 열어 두고, 모인 줄들을 write 한 번으로 붙여 기록
+# (O_APPEND 라 워커 프로세스들이 같은 fd 를 나눠 써도 줄이 섞이지 않음)
+LOG_FD = os.open(LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+# 요청 스레드 -> 로그 스레드 전달 큐(가득 차면 버림)
+LOG_QUEUE_SIZE = 4096
+# 로그 스레드가 한 번의 write 로 기록할 최대 줄 수
+LOG_BATCH_SIZE = 256
+# SimpleQueue 는 C 로 구현되어 put 이 파이썬 수준 락/조건변수를 거치지 않는다.
+_LOG_Q: 'queue.SimpleQueue' = queue.SimpleQueue()
+_LOG_DROPPED = 0
+
+# 콘솔 요약 로그 템플릿(한 번의 % 포맷 후 한 번만 인코딩)
+CONSOLE_LOG_HEAD = '[%s] ip=%s path=%s status=%d'
+CONSOLE_LOG_LOC = ' loc=%s/%s/%s isp="%s"'
+CONSOLE_LOG_UA = ' user-agent="%s"'
+
+
+# 지오로케이션(ip-api.com) 설정. 연결은 스레드마다 하나씩 keep-alive 로 재사용.
+GEO_API_HOST = 'ip-api.com'
+GEO_TIMEOUT = 1.5
+GEO_FIELDS = 'status,country,regionName,city,isp,query'
+GEO_HEADERS = {'User-Agent': 'Python-urllib/3', 'Connection': 'keep-alive'}
+GEO_BATCH_HEADERS = dict(GEO_HEADERS, **{'Content-Type': 'application/json'})
+GEO_BATCH_MAX = 100  # ip-api.com /batch 한 번에 조회 가능한 최대 IP 수
+GEO_CACHE_SIZE = 256
+_GEO_LOCAL = threading.local()
+
+# IP별 조회 결과 LRU 캐시(배치 조회 결과를 채워 넣을 수 있도록 직접 관리)
+_GEO_CACHE: 'OrderedDict[str, Optional[Dict[str, str]]]' = OrderedDict()
+_GEO_CACHE_LOCK = threading.Lock()
+
+# 마지막으로 포맷한 (초, 문자열). 같은 초의 요청들은 strftime 없이 재사용한다.
+_TS_CACHE = (0, '')
+
+
+def format_timestamp(now: float) -> str:
+    """
+    time.time() 값을 YYYY-MM-DD HH:MM:SS 형식 문자열로 반환.
+    초 단위로 캐시하며, 튜플째 교체하므로 여러 스레드가 동시에 불러도 락이 필요 없다.
+    """
+    global _TS_CACHE
+    sec = int(now)
+    cached_sec, text = _TS_CACHE
+    if cached_sec != sec:
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _TS_CACHE = (sec, text)
+    return text
+
 
-if not GEO_LOGGER.handlers:
-    GEO_LOGGER.setLevel(logging.INFO)
-    fh = logging.FileHandler(LOG_FILE, encoding='utf-8')
-    # 메시지 그대로 한 줄 기록(포맷은 _log_access에서 json.dumps로 구성)
-    fh.setFormatter(logging.Formatter('%(message)s'))
-    GEO_LOGGER.addHandler(fh)
-    GEO_LOGGER.propagate = False
+# 마지막으로 만든 (초, HTTP Date 헤더 값). format_timestamp 와 같은 방식으로 초 단위 캐시.
+_HTTP_DATE_CACHE = (0, b'')
 
 
-def format_timestamp(dt: datetime) -> str:
-    """YYYY-MM-DD HH:MM:SS 형식 문자열로 반환."""
-    return dt.strftime('%Y-%m-%d %H:%M:%S')
+def http_date(now: float) -> bytes:
+    """time.time() 값을 HTTP Date 헤더 형식(RFC 1123) bytes로 반환. 초 단위 캐시."""
+    global _HTTP_DATE_CACHE
+    sec = int(now)
+    cached_sec, value = _HTTP_DATE_CACHE
+    if cached_sec != sec:
+        value = formatdate(sec, usegmt=True).encode('ascii')
+        _HTTP_DATE_CACHE = (sec, value)
+    return value
 
 
+def build_response_head(handler_cls, status: str, *headers: str) -> bytes:
+    """
+    상태 줄과 고정 헤더를 미리 인코딩한 응답 헤더 템플릿 생성.
+    요청마다 Date(%s)와 Content-Length(%d)만 채워 한 번의 write로 보낸다.
+    (send_response/send_header 가 만드는 헤더와 순서·내용 동일)
+    """
+    lines = [
+        f'{handler_cls.protocol_version} {status}',
+        f'Server: {handler_cls.server_version} {handler_cls.sys_version}',
+        'Date: %s',
+        *headers,
+        'Content-Length: %d',
+        'Connection: close',
+        '',
+        '',
+    ]
+    return '\r\n'.join(lines).encode('latin-1')
+
+
+@lru_cache(maxsize=4096)
 def is_public_ip(ip: str) -> bool:
-    """사설/루프백/예약/링크로컬이 아닌 공인 IP 여부 판단."""
+    """사설/루프백/예약/링크로컬이 아닌 공인 IP 여부 판단(같은 IP 문자열은 캐시)."""
     try:
         addr = ip_address(ip)
         return not (addr.is_private or addr.is_loopback or addr.is_reserved or addr.is_link_local)
@@ -71,15 +160,43 @@ def is_public_ip(ip: str) -> bool:
         return False
 
 
-@lru_cache(maxsize=256)
-def _geolocate_ip_cached(ip: str) -> Optional[Dict[str, str]]:
-    """IP별 간단 캐시. 외부 호출을 줄이기 위한 내부 함수."""
-    # ip-api.com (무료/제한). 교육·시연용. https 사용 원하면 유료/제한 고려.
-    ## 기본 파이선 라이브러리 하에는 구현할 방법이 없다고 해서, 외부 서비스를 사용했습니다. 동작 방법은 명확히 모릅니다.
-    url = f'http://ip-api.com/json/{quote(ip)}?fields=status,country,regionName,city,isp,query'
-    req = Request(url, headers={'User-Agent': 'Python-urllib/3'})
-    with urlopen(req, timeout=1.5) as resp:
-        data = json.loads(resp.read().decode('utf-8', errors='replace'))
+def _geo_request(method: str, path: str, body: Optional[bytes] = None) -> bytes:
+    """
+    ip-api.com 에 요청하고 응답 본문 반환.
+    스레드마다 keep-alive 연결 하나를 재사용해 조회마다 TCP 연결을 새로 맺지 않는다.
+    """
+    conn = getattr(_GEO_LOCAL, 'conn', None)
+    if conn is not None:
+        try:
+            return _geo_send(conn, method, path, body)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # 서버가 유휴 연결을 끊은 경우: 새 연결로 한 번만 다시 시도
+            conn.close()
+        except Exception:
+            conn.close()
+            _GEO_LOCAL.conn = None
+            raise
+
+    conn = http.client.HTTPConnection(GEO_API_HOST, timeout=GEO_TIMEOUT)
+    _GEO_LOCAL.conn = conn
+    try:
+        return _geo_send(conn, method, path, body)
+    except Exception:
+        conn.close()
+        _GEO_LOCAL.conn = None
+        raise
+
+
+def _geo_send(conn: http.client.HTTPConnection, method: str, path: str, body: Optional[bytes]) -> bytes:
+    """연결 하나로 요청 1회 송수신(응답 본문을 끝까지 읽어야 연결을 다시 쓸 수 있음)."""
+    headers = GEO_HEADERS if body is None else GEO_BATCH_HEADERS
+    conn.request(method, path, body=body, headers=headers)
+    with conn.getresponse() as resp:
+        return resp.read()
+
+
+def _parse_geo(data: object) -> Optional[Dict[str, str]]:
+    """ip-api.com 응답 항목 하나를 (국가/지역/도시/ISP) dict로 변환. 실패 응답이면 None."""
     if isinstance(data, dict) and data.get('status') == 'success':
         return {
             'country': data.get('country'),
@@ -90,6 +207,37 @@ def _geolocate_ip_cached(ip: str) -> Optional[Dict[str, str]]:
     return None
 
 
+def _geo_cache_get(ip: str) -> Tuple[bool, Optional[Dict[str, str]]]:
+    """캐시 조회. (적중 여부, 결과) 반환."""
+    with _GEO_CACHE_LOCK:
+        if ip not in _GEO_CACHE:
+            return False, None
+        _GEO_CACHE.move_to_end(ip)
+        return True, _GEO_CACHE[ip]
+
+
+def _geo_cache_put(ip: str, location: Optional[Dict[str, str]]) -> None:
+    """조회 결과 저장. GEO_CACHE_SIZE 를 넘으면 가장 오래 안 쓴 항목부터 버림."""
+    with _GEO_CACHE_LOCK:
+        _GEO_CACHE[ip] = location
+        _GEO_CACHE.move_to_end(ip)
+        while len(_GEO_CACHE) > GEO_CACHE_SIZE:
+            _GEO_CACHE.popitem(last=False)
+
+
+def _geolocate_ip_cached(ip: str) -> Optional[Dict[str, str]]:
+    """IP별 간단 캐시. 외부 호출을 줄이기 위한 내부 함수."""
+    hit, location = _geo_cache_get(ip)
+    if hit:
+        return location
+    # ip-api.com (무료/제한). 교육·시연용. https 사용 원하면 유료/제한 고려.
+    ## 기본 파이선 라이브러리 하에는 구현할 방법이 없다고 해서, 외부 서비스를 사용했습니다. 동작 방법은 명확히 모릅니다.
+    body = _geo_request('GET', f'/json/{quote(ip)}?fields={GEO_FIELDS}')
+    location = _parse_geo(json.loads(body.decode('utf-8', errors='replace')))
+    _geo_cache_put(ip, location)
+    return location
+
+
 def geolocate_ip(ip: str) -> Optional[Dict[str, str]]:
     """
     공인 IP일 때만 간단 지오로케이션 조회(국가/지역/도시/ISP).
@@ -103,93 +251,278 @@ def geolocate_ip(ip: str) -> Optional[Dict[str, str]]:
         return None
 
 
-def read_index_bytes(path: str) -> bytes:
-    """index.html을 바이트로 읽어 반환. 파일 없으면 FileNotFoundError."""
-    with open(path, 'rb') as f:
-        return f.read()
+def geolocate_many(ips: Iterable[str]) -> None:
+    """
+    여러 IP 중 캐시에 없는 공인 IP들을 ip-api.com /batch 로 한꺼번에 조회해 캐시를 채움.
+    이후 geolocate_ip 는 캐시에서 바로 결과를 얻는다(실패 시 개별 조회로 대체).
+    """
+    missing = [
+        ip for ip in dict.fromkeys(ips)
+        if is_public_ip(ip) and not _geo_cache_get(ip)[0]
+    ]
+    if len(missing) < 2:
+        # 1건은 개별 조회(GET)와 비용이 같음
+        return
+
+    for start in range(0, len(missing), GEO_BATCH_MAX):
+        chunk = missing[start:start + GEO_BATCH_MAX]
+        payload = json.dumps([{'query': ip, 'fields': GEO_FIELDS} for ip in chunk]).encode('utf-8')
+        try:
+            body = _geo_request('POST', '/batch', payload)
+            results = json.loads(body.decode('utf-8', errors='replace'))
+        except Exception:
+            return
+        if not isinstance(results, list) or len(results) != len(chunk):
+            return
+        for ip, data in zip(chunk, results):
+            _geo_cache_put(ip, _parse_geo(data))
+
+
+def load_index(path: str) -> Tuple[int, Optional[bytes]]:
+    """
+    index.html의 (크기, 본문) 반환. 파일 없으면 FileNotFoundError.
+    - 본문은 메모리에 캐시해 두고, mtime/크기가 바뀌었을 때만 다시 읽음
+    - INDEX_CACHE_MAX_SIZE 보다 큰 파일은 캐시하지 않고 본문 None 반환(sendfile로 전송)
+    """
+    global _INDEX_CACHE
+    st = os.stat(path)
+    if st.st_size > INDEX_CACHE_MAX_SIZE:
+        return st.st_size, None
+
+    key = (path, st.st_mtime_ns, st.st_size)
+    cached_key, data = _INDEX_CACHE
+    if cached_key == key:
+        return len(data), data
+
+    with _INDEX_LOCK:
+        # 락을 기다리는 사이 다른 스레드가 이미 다시 읽었으면 그대로 사용
+        cached_key, data = _INDEX_CACHE
+        if cached_key != key:
+            with open(path, 'rb') as f:
+                data = f.read()
+            _INDEX_CACHE = (key, data)
+    return len(data), data
+
+
+def build_access_log(now: float, ip: str, path: str, ua: str, status: int) -> Tuple[bytes, bytes]:
+    """지오로케이션 조회 후 (콘솔 요약 한 줄, 파일에 누적할 NDJSON 한 줄) 을 bytes 로 반환."""
+    location = geolocate_ip(ip)
+    ts = format_timestamp(now)
+
+    # 콘솔용 요약 로그
+    console = CONSOLE_LOG_HEAD % (ts, ip, path, status)
+    if location:
+        console += CONSOLE_LOG_LOC % (
+            location.get('country'),
+            location.get('region'),
+            location.get('city'),
+            location.get('isp') or '-',
+        )
+    if ua and ua != '-':
+        console += CONSOLE_LOG_UA % ua
+    console_line = (console + '\n').encode('utf-8', 'replace')
+
+    # 파일 누적 로그(NDJSON). 위치가 없어도 한 줄씩 기록.
+    entry = {
+        'ts': ts,
+        'ip': ip,
+        'path': path,
+        'status': status,
+        'ua': ua if ua and ua != '-' else None,
+        'country': location.get('country') if location else None,
+        'region': location.get('region') if location else None,
+        'city': location.get('city') if location else None,
+        'isp': location.get('isp') if location else None,
+    }
+    if orjson is not None:
+        return console_line, orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return console_line, json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def write_console_lines(lines: List[bytes]) -> None:
+    """콘솔 요약 줄들을 이어 붙여 표준출력에 한 번 쓰고, 묶음마다 한 번만 flush."""
+    out = getattr(sys.stdout, 'buffer', None)
+    try:
+        if out is None:
+            sys.stdout.write(b''.join(lines).decode('utf-8'))
+            sys.stdout.flush()
+        else:
+            out.write(b''.join(lines))
+            out.flush()
+    except (OSError, ValueError):
+        # 콘솔이 닫혔어도 서버 동작은 방해하지 않음
+        pass
+
+
+def write_log_lines(lines: List[bytes]) -> None:
+    """NDJSON 줄들을 이어 붙여 로그 파일에 한 번에 기록."""
+    view = memoryview(b''.join(lines))
+    try:
+        while view:
+            written = os.write(LOG_FD, view)
+            view = view[written:]
+    except OSError:
+        # 파일 쓰기 실패가 있더라도 서버 동작은 방해하지 않음
+        pass
+
+
+def _log_worker() -> None:
+    """
+    로그 큐를 비우는 백그라운드 스레드 본체. None 을 받으면 남은 로그를 기록하고 종료.
+    큐에 쌓여 있는 로그를 최대 LOG_BATCH_SIZE 건씩 한꺼번에 꺼내 파일에는 한 번만 쓴다.
+    """
+    while True:
+        batch = [_LOG_Q.get()]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(_LOG_Q.get_nowait())
+            except queue.Empty:
+                break
+
+        # 이번 묶음에 처음 보는 공인 IP가 여럿이면 배치 API 한 번으로 미리 조회
+        geolocate_many(item[1] for item in batch if item is not None)
+
+        console_lines = []
+        lines = []
+        stop = False
+        for item in batch:
+            if item is None:
+                stop = True
+                continue
+            try:
+                console_line, line = build_access_log(*item)
+            except Exception:
+                # 로그 한 건의 실패가 스레드를 멈추지 않도록 함
+                continue
+            console_lines.append(console_line)
+            lines.append(line)
+        if lines:
+            write_console_lines(console_lines)
+            write_log_lines(lines)
+        if stop:
+            return
+
+
+def start_log_worker() -> threading.Thread:
+    """프로세스마다 로그 스레드 1개 시작(fork 이후 각 프로세스에서 호출)."""
+    thread = threading.Thread(target=_log_worker, name='access-log', daemon=True)
+    thread.start()
+    return thread
+
+
+def stop_log_worker(thread: threading.Thread) -> None:
+    """큐에 남은 로그를 모두 기록한 뒤 로그 스레드 종료."""
+    _LOG_Q.put(None)
+    thread.join(timeout=5.0)
+    if _LOG_DROPPED:
+        print(f'로그 큐가 가득 차 버린 로그: {_LOG_DROPPED}건', file=sys.stderr, flush=True)
+
+
+def get_worker_count() -> int:
+    """
+    워커 프로세스 수 결정(WORKERS 환경변수, 기본: CPU 코어 수).
+    fork 나 SO_REUSEPORT 를 지원하지 않는 플랫폼(윈도우 등)에서는 1.
+    """
+    if not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+        return 1
+    workers_env = os.environ.get('WORKERS')
+    workers = int(workers_env) if workers_env else (os.cpu_count() or 1)
+    return max(1, workers)
+
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """
+    SO_REUSEPORT 를 켜고 바인딩하는 멀티스레드 HTTP 서버.
+    프로세스마다 자기 수신 대기 소켓을 가지므로 커널이 새 연결을 프로세스들에 고르게 나눠 준다.
+    """
+
+    def server_bind(self) -> None:
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def _handle_sigterm(signum, frame) -> None:
+    """SIGTERM 도 Ctrl+C 와 같은 종료 흐름을 타도록 변환."""
+    raise KeyboardInterrupt
 
 
 class PirateRequestHandler(BaseHTTPRequestHandler):
     """GET/HEAD 요청을 처리하는 멀티스레드용 핸들러."""
 
     server_version = 'PirateHTTP/1.1'
+    # rfile/wfile 을 버퍼링 파일로 사용: 헤더와 본문을 사용자 공간에서 모았다가
+    # 요청 처리가 끝날 때(finish) 한 번의 send 로 내보낸다.
+    rbufsize = READ_BUFFER_SIZE
+    wbufsize = WRITE_BUFFER_SIZE
+
+    def setup(self) -> None:
+        """연결 소켓 옵션 설정: Nagle 지연 없이 바로 보내고, 응답 전체가 송신 버퍼에 들어가도록 확장."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
 
     # ===== 메서드 디스패치 =====
 
     def do_GET(self) -> None:
         """GET 처리: / 또는 /index.html 은 로컬 파일 제공, 그 외 404."""
-        now = datetime.now()
+        now = time.time()
         client_ip = self._get_client_ip()
         path = self.path or '/'
         ua = self.headers.get('User-Agent', '-')
-        location = geolocate_ip(client_ip)
 
         if path in ('/', '/index.html'):
             try:
-                body = read_index_bytes(INDEX_FILE)
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/html; charset=utf-8')
-                self.send_header('Content-Length', str(len(body)))
-                self.send_header('Connection', 'close')
-                self.end_headers()
-                # 대용량 대비 안전 전송(멀티스레드 환경에서도 OK)
-                sent = 0
-                total = len(body)
-                while sent < total:
-                    chunk = body[sent:sent + READ_BUFFER_SIZE]
-                    self.wfile.write(chunk)
-                    sent += len(chunk)
-                self._log_access(now, client_ip, path, ua, location, status=200)
+                _size, body = load_index(INDEX_FILE)
+                if body is None:
+                    self._send_index_file()
+                else:
+                    self._write_head(INDEX_HEAD, len(body), now)
+                    # 캐시 대상은 INDEX_CACHE_MAX_SIZE 이하이므로 잘라 쓰지 않고 한 번에 write
+                    self.wfile.write(body)
+                self._log_access(now, client_ip, path, ua, status=200)
             except FileNotFoundError:
                 self._send_text(404, 'index.html not found')
-                self._log_access(now, client_ip, path, ua, location, status=404)
+                self._log_access(now, client_ip, path, ua, status=404)
             except Exception as exc:
                 msg = f'Internal server error: {exc}'
                 self._send_text(500, msg)
-                self._log_access(now, client_ip, path, ua, location, status=500)
+                self._log_access(now, client_ip, path, ua, status=500)
         else:
-            self._send_text(404, 'Not found')
-            self._log_access(now, client_ip, path, ua, location, status=404)
+            self._write_head(NOT_FOUND_HEAD, len(NOT_FOUND_BODY), now)
+            self.wfile.write(NOT_FOUND_BODY)
+            self._log_access(now, client_ip, path, ua, status=404)
 
     def do_HEAD(self) -> None:
         """HEAD 처리: 본문 없이 헤더만 송신."""
-        now = datetime.now()
+        now = time.time()
         client_ip = self._get_client_ip()
         path = self.path or '/'
         ua = self.headers.get('User-Agent', '-')
-        location = geolocate_ip(client_ip)
 
         if path in ('/', '/index.html'):
             try:
-                body = read_index_bytes(INDEX_FILE)
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/html; charset=utf-8')
-                self.send_header('Content-Length', str(len(body)))
-                self.send_header('Connection', 'close')
-                self.end_headers()
+                size, _body = load_index(INDEX_FILE)
+                self._write_head(INDEX_HEAD, size, now)
                 # 본문은 쓰지 않음
-                self._log_access(now, client_ip, path, ua, location, status=200)
+                self._log_access(now, client_ip, path, ua, status=200)
             except FileNotFoundError:
                 self.send_response(404)
                 self.send_header('Content-Type', 'text/plain; charset=utf-8')
                 self.send_header('Content-Length', '0')
                 self.send_header('Connection', 'close')
                 self.end_headers()
-                self._log_access(now, client_ip, path, ua, location, status=404)
+                self._log_access(now, client_ip, path, ua, status=404)
             except Exception:
                 self.send_response(500)
                 self.send_header('Content-Type', 'text/plain; charset=utf-8')
                 self.send_header('Content-Length', '0')
                 self.send_header('Connection', 'close')
                 self.end_headers()
-                self._log_access(now, client_ip, path, ua, location, status=500)
+                self._log_access(now, client_ip, path, ua, status=500)
         else:
-            self.send_response(404)
-            self.send_header('Content-Type', 'text/plain; charset=utf-8')
-            self.send_header('Content-Length', '0')
-            self.send_header('Connection', 'close')
-            self.end_headers()
-            self._log_access(now, client_ip, path, ua, location, status=404)
+            self._write_head(NOT_FOUND_HEAD, 0, now)
+            self._log_access(now, client_ip, path, ua, status=404)
 
     # 비허용 메서드는 405로 응답(Allow 헤더 부착)
     def do_POST(self) -> None:
@@ -206,16 +539,29 @@ class PirateRequestHandler(BaseHTTPRequestHandler):
 
     # ===== 헬퍼 =====
 
+    def _write_head(self, head: bytes, length: int, now: float) -> None:
+        """미리 인코딩한 응답 헤더 템플릿에 Date/Content-Length만 채워 한 번에 전송."""
+        self.close_connection = True
+        self.wfile.write(head % (http_date(now), length))
+
+    def _send_index_file(self) -> None:
+        """캐시하기에 큰 index.html을 파일에서 바로 전송."""
+        with open(INDEX_FILE, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(size))
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.wfile.flush()
+            # 파일 내용을 파이썬으로 읽지 않고 커널이 페이지 캐시에서 소켓으로 바로 전송(zero-copy)
+            # os.sendfile 이 없는 플랫폼에서는 socket.sendfile 이 알아서 read/send 로 대체
+            self.connection.sendfile(f)
+
     def _respond_405(self) -> None:
         """허용되지 않은 메서드에 대해 405 반환."""
-        body = b'Method Not Allowed'
-        self.send_response(405)
-        self.send_header('Allow', 'GET, HEAD')
-        self.send_header('Content-Type', 'text/plain; charset=utf-8')
-        self.send_header('Content-Length', str(len(body)))
-        self.send_header('Connection', 'close')
-        self.end_headers()
-        self.wfile.write(body)
+        self._write_head(NOT_ALLOWED_HEAD, len(NOT_ALLOWED_BODY), time.time())
+        self.wfile.write(NOT_ALLOWED_BODY)
 
     def _send_text(self, code: int, text: str) -> None:
         """간단 텍스트 응답 유틸리티."""
@@ -245,52 +591,35 @@ class PirateRequestHandler(BaseHTTPRequestHandler):
             return cfc.strip()
         return self.client_address[0] if self.client_address else '-'
 
-    def _log_access(
-        self,
-        now: datetime,
-        ip: str,
-        path: str,
-        ua: str,
-        location: Optional[Dict[str, str]],
-        status: int,
-    ) -> None:
-        """요청 로그 한 줄 출력 + NDJSON 파일 누적 저장."""
-        ts = format_timestamp(now)
-
-        # 콘솔용 요약 로그
-        parts = [f'[{ts}] ip={ip}', f'path={path}', f'status={status}']
-        if location:
-            loc_str = f"{location.get('country')}/{location.get('region')}/{location.get('city')}"
-            isp = location.get('isp') or '-'
-            parts.append(f'loc={loc_str}')
-            parts.append(f'isp="{isp}"')
-        if ua and ua != '-':
-            parts.append(f'user-agent="{ua}"')
-        print(' '.join(parts), flush=True)
-
-        # 파일 누적 로그(NDJSON). 위치가 없어도 한 줄씩 기록.
-        try:
-            entry = {
-                'ts': ts,
-                'ip': ip,
-                'path': path,
-                'status': status,
-                'ua': ua if ua and ua != '-' else None,
-                'country': location.get('country') if location else None,
-                'region': location.get('region') if location else None,
-                'city': location.get('city') if location else None,
-                'isp': location.get('isp') if location else None,
-            }
-            GEO_LOGGER.info(json.dumps(entry, ensure_ascii=False))
-        except Exception:
-            # 파일 쓰기 실패가 있더라도 본 응답 흐름은 방해하지 않음
-            pass
+    def _log_access(self, now: float, ip: str, path: str, ua: str, status: int) -> None:
+        """요청 로그를 로그 큐에 넣기만 함(지오로케이션/출력/파일 기록은 로그 스레드가 처리)."""
+        global _LOG_DROPPED
+        if _LOG_Q.qsize() >= LOG_QUEUE_SIZE:
+            # 로그 스레드가 밀려 있으면 응답을 막지 않고 버림
+            _LOG_DROPPED += 1
+            return
+        _LOG_Q.put((now, ip, path, ua, status))
 
     # BaseHTTPRequestHandler 기본 로깅 비활성화
     def log_message(self, format: str, *args) -> None:  # noqa: A003
         return
 
 
+# 자주 나가는 응답의 헤더 템플릿과 본문(요청마다 만들지 않음)
+INDEX_HEAD = build_response_head(
+    PirateRequestHandler, '200 OK', 'Content-Type: text/html; charset=utf-8'
+)
+NOT_FOUND_HEAD = build_response_head(
+    PirateRequestHandler, '404 Not Found', 'Content-Type: text/plain; charset=utf-8'
+)
+NOT_ALLOWED_HEAD = build_response_head(
+    PirateRequestHandler, '405 Method Not Allowed',
+    'Allow: GET, HEAD', 'Content-Type: text/plain; charset=utf-8',
+)
+NOT_FOUND_BODY = b'Not found'
+NOT_ALLOWED_BODY = b'Method Not Allowed'
+
+
 def main() -> None:
     """서버 실행 엔트리포인트."""
     host = os.environ.get('BIND_HOST', DEFAULT_HOST)
@@ -309,10 +638,39 @@ def main() -> None:
         sock.close()
 
     server_address = (host, port)
-    httpd = ThreadingHTTPServer(server_address, PirateRequestHandler)
+    workers = get_worker_count()
+
+    # fork 전에 index.html 캐시를 채워 두면 자식 프로세스들이 같은 메모리 페이지를 공유(copy-on-write)
+    try:
+        load_index(INDEX_FILE)
+    except OSError:
+        pass
+
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            # 자식 프로세스: Ctrl+C 는 부모가 받아 SIGTERM 으로 정리하므로 무시
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, _handle_sigterm)
+            log_thread = start_log_worker()
+            child_httpd = ReusePortHTTPServer(server_address, PirateRequestHandler)
+            try:
+                child_httpd.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                child_httpd.server_close()
+                stop_log_worker(log_thread)
+                os._exit(0)
+        children.append(pid)
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    log_thread = start_log_worker()
+    httpd = ReusePortHTTPServer(server_address, PirateRequestHandler)
     bind_info = host if host != '0.0.0.0' else '0.0.0.0(모든 인터페이스)'
     try:
-        print(f'HTTP 서버 시작(멀티스레드): http://localhost:{port}/  (바인드: {bind_info})', flush=True)
+        print(f'HTTP 서버 시작(멀티스레드, 워커 프로세스 {workers}개): http://localhost:{port}/  (바인드: {bind_info})', flush=True)
         print(f'지오 로그 파일: {LOG_FILE}', flush=True)
         print('중지하려면 Ctrl+C 를 누르세요.', flush=True)
         httpd.serve_forever()
@@ -320,6 +678,17 @@ def main() -> None:
         print('\n서버 종료 중...', flush=True)
     finally:
         httpd.server_close()
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        stop_log_worker(log_thread)
         print('서버가 정상 종료되었습니다.', flush=True)
 
 
@@ -22,6 +22,7 @@ crawling_KBS.py (rev6: XHR 전용 / 파라미터 고정값 반영)
 --date YYYYMMDD → datetimeBegin={YYYYMMDD}000000, datetimeEnd={YYYYMMDD}235959를 설정
 
 --page, --rows → currentPageNo, rowsPerPage를 설정.
+  (--page 1 2 3 처럼 여러 페이지를 주면 동시에 요청한 뒤 페이지 순서대로 출력)
 
 가변 파라미터의 내용은 KBS의 헤드라인 표기용 요청에서 사용하는 실제 requestParam입니다. 
 """
@@ -29,20 +30,37 @@ crawling_KBS.py (rev6: XHR 전용 / 파라미터 고정값 반영)
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import re
 import sys
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterable, List, Mapping, Optional
 from urllib.parse import urlencode, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup  # 보너스(KOSPI)용
 
+try:
+    # 설치되어 있으면 응답 JSON 디코딩에 orjson 사용(C 구현, bytes 에서 바로 디코딩)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # 설치되어 있으면 KOSPI 페이지 파싱에 selectolax 사용(C 구현 HTML 파서, 필요한 노드만 CSS로 조회)
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 # --------------- 상수 ---------------
 KBS_BASE = 'https://news.kbs.co.kr'
 KBS_XHR_PATH = '/api/getNewsList'
 DEFAULT_TIMEOUT = 15  # seconds
+MAX_CONCURRENT_FETCHES = 8  # 여러 페이지 동시 요청 수 상한
 
 # 고정값 (요청자 요구)
 FIXED_EXCEPT_PHOTO = 'Y'
@@ -55,6 +73,25 @@ DEFAULT_ROWS = 12
 
 NAVER_KOSPI_URL = 'https://finance.naver.com/sise/sise_index.naver?code=KOSPI'
 
+# 항목마다 호출되는 clean_text 와 KOSPI 값 확인에 쓰는 정규식은 한 번만 컴파일해 둔다.
+# (\s 는 NBSP(\xa0)도 포함하므로 따로 치환하지 않아도 공백 하나로 합쳐진다)
+_WS_RE = re.compile(r'\s+')
+_KOSPI_NUMBER_RE = re.compile(r'[\d,]+(\.\d+)?')
+
+# 모든 요청이 공유하는 세션. 호스트별 keep-alive 연결을 재사용해 요청마다 TCP/TLS 핸드셰이크를 하지 않는다.
+# (urllib3 기본 소켓 옵션에 TCP_NODELAY 가 이미 포함되어 있다)
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'Accept-Language': 'ko,ko-KR;q=0.9,en;q=0.8',
+})
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_FETCHES, max_retries=2)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
 
 # --------------- 데이터 클래스 ---------------
 @dataclass
@@ -90,9 +127,7 @@ def setup_logging(debug: bool) -> None:
 
 # --------------- 유틸 ---------------
 def clean_text(text: str) -> str:
-    text = text.replace('\xa0', ' ').strip()
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    return _WS_RE.sub(' ', text).strip()
 
 
 def _first_key(d: Mapping[str, Any], keys: Iterable[str]) -> Optional[Any]:
@@ -124,6 +159,8 @@ def _to_abs_url(u: str) -> str:
 
 
 # --------------- XHR 호출/파싱 ---------------
+# 인자가 모두 해시 가능한 스칼라이므로, 같은 (날짜, 페이지, 행 수) 조합은 urlencode 없이 재사용
+@lru_cache(maxsize=64)
 def build_xhr_url(date_str: str, page: int, rows: int) -> str:
     begin = f'{date_str}000000'
     end = f'{date_str}235959'
@@ -143,17 +180,9 @@ def build_xhr_url(date_str: str, page: int, rows: int) -> str:
 
 def fetch_json(url: str) -> Any:
     logger.debug(f'[fetch_json] 요청 URL: {url}')
-    resp = requests.get(
+    resp = _HTTP.get(
         url,
-        headers={
-            'User-Agent': (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            ),
-            'Accept': 'application/json,text/plain,*/*',
-            'Accept-Language': 'ko,ko-KR;q=0.9,en;q=0.8',
-            'Connection': 'close',
-        },
+        headers={'Accept': 'application/json,text/plain,*/*'},
         timeout=DEFAULT_TIMEOUT,
     )
     logger.debug(
@@ -162,7 +191,8 @@ def fetch_json(url: str) -> Any:
     )
     resp.raise_for_status()
     try:
-        data = resp.json()
+        # resp.json() 처럼 본문을 str 로 디코딩(문자셋 추정 포함)하지 않고 bytes 에서 바로 파싱
+        data = orjson.loads(resp.content) if orjson is not None else json.loads(resp.content)
     except Exception:
         logger.exception('[fetch_json] JSON 디코드 실패')
         raise
@@ -170,6 +200,18 @@ def fetch_json(url: str) -> Any:
     return data
 
 
+def fetch_pages(date_str: str, pages: List[int], rows: int) -> List[Any]:
+    """
+    여러 페이지를 동시에 요청해 페이지 순서대로 JSON 목록을 반환한다.
+    요청 대부분이 네트워크 대기이므로, 전체 소요 시간이 페이지별 시간의 합이 아니라 가장 느린 한 건 수준이 된다.
+    """
+    urls = [build_xhr_url(date_str, page, rows) for page in pages]
+    if len(urls) == 1:
+        return [fetch_json(urls[0])]
+    with ThreadPoolExecutor(max_workers=min(len(urls), MAX_CONCURRENT_FETCHES)) as pool:
+        return list(pool.map(fetch_json, urls))
+
+
 def parse_results_from_json(data: Any) -> List[CrawlingResult]:
     """
     다양한 JSON 스키마를 견디도록 후보 키를 폭넓게 탐색한다.
@@ -199,26 +241,32 @@ def parse_results_from_json(data: Any) -> List[CrawlingResult]:
         logger.warning('[parse_results_from_json] 목록을 찾지 못함')
         return results
 
+    # 항목 수만큼 도는 루프이므로, 로그 레벨 확인은 한 번만 하고 메시지는 INFO 가 켜져 있을 때만 만든다.
+    log_items = logger.isEnabledFor(logging.INFO)
+    append = results.append
+
     for i, item in enumerate(candidates):
         if not isinstance(item, dict):
-            logger.debug(f'  [json#{i}] dict 아님 -> 스킵 ({type(item).__name__})')
+            logger.debug('  [json#%d] dict 아님 -> 스킵 (%s)', i, type(item).__name__)
             continue
+        g = item.get
 
         # 제목
-        title_str = clean_text(str(item.get('newsTitle', '')))
+        title_str = clean_text(str(g('newsTitle', '')))
 
         # 이미지
-        img_src   = _to_abs_url(str(item.get('imgUrl', '')))
+        img_src   = _to_abs_url(str(g('imgUrl', '')))
 
         # 날짜
-        date_text = clean_text(str(item.get('deskTime', '')))
+        date_text = clean_text(str(g('deskTime', '')))
         
         # 링크
-        link_str =_to_abs_url(str(item.get('newsCode', '')))
+        link_str =_to_abs_url(str(g('newsCode', '')))
 
         result = CrawlingResult(title=title_str, image_src=img_src, date=date_text, link=link_str)
-        logger.info(f'{item_index}번째 객체 생성 : {asdict(result)}')
-        results.append(result)
+        if log_items:
+            logger.info('%d번째 객체 생성 : %r', item_index, result)
+        append(result)
         item_index += 1
 
     logger.debug(f'[parse_results_from_json] 결과 수: {len(results)}')
@@ -226,21 +274,33 @@ def parse_results_from_json(data: Any) -> List[CrawlingResult]:
 
 
 # --------------- 보너스(KOSPI) ---------------
+def _node_text_selectolax(el: Any) -> str:
+    return el.text(separator=' ', strip=True)
+
+
+def _node_text_bs4(el: Any) -> str:
+    return el.get_text(' ', strip=True)
+
+
 def get_kospi_index() -> str:
     logger.debug('[get_kospi_index] 네이버 금융 요청')
-    resp = requests.get(NAVER_KOSPI_URL, timeout=DEFAULT_TIMEOUT, headers={
-        'User-Agent': 'Mozilla/5.0',
-        'Accept-Language': 'ko,ko-KR;q=0.9,en;q=0.8',
-    })
+    resp = _HTTP.get(NAVER_KOSPI_URL, timeout=DEFAULT_TIMEOUT)
     logger.debug(f'[get_kospi_index] 응답 코드: {resp.status_code}, 길이: {len(resp.content)} bytes')
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    if HTMLParser is not None:
+        tree = HTMLParser(resp.text)
+        select_one = tree.css_first
+        get_text = _node_text_selectolax
+    else:
+        soup = BeautifulSoup(resp.text, 'html.parser')
+        select_one = soup.select_one
+        get_text = _node_text_bs4
     for sel in ['#now_value', '.now_value', '.price', '.num']:
-        el = soup.select_one(sel)
+        el = select_one(sel)
         logger.debug(f'[get_kospi_index] 셀렉터 "{sel}" -> {"HIT" if el else "MISS"}')
         if el:
-            txt = clean_text(el.get_text(' ', strip=True))
-            if re.search(r'[\d,]+(\.\d+)?', txt):
+            txt = clean_text(get_text(el))
+            if _KOSPI_NUMBER_RE.search(txt):
                 logger.debug(f'[get_kospi_index] 파싱값="{txt}"')
                 return txt
     logger.warning('[get_kospi_index] 파싱 실패')
@@ -251,7 +311,7 @@ def get_kospi_index() -> str:
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description='KBS 헤드라인 크롤러 (rev6, XHR 전용)')
     p.add_argument('--date', default=DEFAULT_DATE, help='YYYYMMDD (기본: 20250925)')
-    p.add_argument('--page', type=int, default=DEFAULT_PAGE, help='페이지 번호 (기본: 1)')
+    p.add_argument('--page', type=int, nargs='+', default=[DEFAULT_PAGE], help='페이지 번호, 여러 개 지정 가능 (기본: 1)')
     p.add_argument('--rows', type=int, default=DEFAULT_ROWS, help='행 수 (기본: 12)')
     p.add_argument('--bonus', action='store_true', help='KOSPI 지수도 함께 출력')
     p.add_argument('--debug', action='store_true', help='DEBUG 로그')
@@ -264,14 +324,17 @@ def main() -> None:
 
     logger.info(f'[main] 시작: date={args.date}, page={args.page}, rows={args.rows}')
     try:
-        url = build_xhr_url(args.date, args.page, args.rows)
-        data = fetch_json(url)
-        results = parse_results_from_json(data)
+        results = [
+            result
+            for data in fetch_pages(args.date, args.page, args.rows)
+            for result in parse_results_from_json(data)
+        ]
     except Exception:
         logger.exception('[main] 수집 중 오류')
         results = []
 
-    print(f'KBS 헤드라인 목록 (XHR, date={args.date}, page={args.page}):')
+    pages = ','.join(str(page) for page in args.page)
+    print(f'KBS 헤드라인 목록 (XHR, date={args.date}, page={pages}):')
     for i, item in enumerate(results, 1):
         print(f'{i:02d}. {item}')
 
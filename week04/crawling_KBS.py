@@ -2,6 +2,10 @@
 동작 방법 : 
 python {{ide 루트에 기반한 상대경로 추가}}/crawling_KBS.py --id {{사용할 네이버 아이디}} --pw {{사용할 네이버 비밀번호}} (--headless)
 => --headless 옵션을 사용할 경우, 현 기기 내에서 브라우저를 직접 실행하지 않고 로그인 및 쿠키 획득 프로세스를 진행한다고 합니다.
+=> --js-input 옵션을 사용할 경우, 클립보드 붙여넣기 대신 스크립트로 ID/PW 값을 바로 넣습니다. (빠르지만 자동 입력으로 감지되어 2차 인증이 뜰 수 있습니다)
+=> --pretty 옵션을 사용할 경우, 마지막 메일 목록 JSON을 들여쓰기해서 출력합니다. (기본은 한 줄 출력)
+=> 크롬 프로필을 week04/.chrome_profile 에 저장하므로, 다음 실행부터는 로그인 상태가 남아 있으면 로그인 과정을 건너뜁니다.
+   (--force-login 옵션을 사용하면 저장된 로그인 상태와 상관없이 다시 로그인합니다)
 
 
 구현 내역 : 
@@ -41,23 +45,30 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Final
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Final
 
-import requests
 from http.cookiejar import LWPCookieJar
 
-from selenium import webdriver
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
+# requests / selenium 은 import 비용이 커서(수백 ms) 실제로 쓰는 함수 안에서 불러온다.
+# 덕분에 --help 처럼 인자만 확인하고 끝나는 실행은 바로 반환된다.
+if TYPE_CHECKING:
+    import requests
+    from selenium import webdriver
 
 from win_clipboard import set_clipboard
 
+try:
+    # 설치되어 있으면 쿠키 JSON 저장에 orjson 사용(C 구현, 들여쓰기 포함 한 번에 bytes 로 직렬화)
+    import orjson
+except ImportError:
+    orjson = None
+
 from datetime import datetime
 
 def _nowstamp() -> str:
@@ -87,22 +98,87 @@ NAVER_PW: Final[str] = ''
 
 # ===== 설정 =====
 NAVER_LOGIN_URL: Final[str] = 'https://nid.naver.com/nidlogin.login?mode=form&url=https://www.naver.com/'
+NAVER_HOME_URL: Final[str] = 'https://www.naver.com/'
+# 크롬 프로필(쿠키 포함)을 실행 간에 유지할 폴더. 이전 실행의 로그인 상태가 남아 있으면 로그인을 건너뛴다.
+CHROME_PROFILE_DIR: Final[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.chrome_profile')
+LOGIN_PROBE_SEC: Final[int] = 5  # 저장된 로그인 상태 확인 시 닉네임 영역을 기다리는 최대 시간
 DEFAULT_WAIT_SEC: Final[int] = 25
+DEFAULT_POLL_SEC: Final[float] = 0.1  # 명시적 대기의 폴링 간격(기본 0.5초보다 빨리 감지)
+
+# requests 세션의 연결 풀/재시도 설정 (5xx·429 응답은 지수 백오프로 재시도, POST 는 재시도하지 않음)
+HTTP_POOL_CONNECTIONS: Final[int] = 4
+HTTP_POOL_MAXSIZE: Final[int] = 8
+HTTP_RETRY_TOTAL: Final[int] = 3
+HTTP_RETRY_BACKOFF: Final[float] = 0.2
+HTTP_RETRY_STATUSES: Final[tuple[int, ...]] = (429, 500, 502, 503, 504)
+
+# receivedTime(UNIX 초) → KST 표기 변환용 (datetime 객체 없이 time.gmtime + % 포맷)
+KST_OFFSET_SEC: Final[int] = 9 * 3600
+KST_TIME_FORMAT: Final[str] = '%04d-%02d-%02d %02d:%02d:%02d UTC+09:00'
+
 HEADLESS: bool = False  # argparse로 토글
+JS_INPUT: bool = False  # argparse로 토글 (True 면 클립보드 대신 스크립트로 값 주입)
 
 # ===== 선택자 (요청한 클래스 기반 유지) =====
 LOGIN_ID_INPUT_CSS: Final[str] = '.input_item.id input'
 LOGIN_PW_INPUT_CSS: Final[str] = '.input_item.pw input'
 LOGIN_SUBMIT_BTN_CSS: Final[str] = '.btn_login_wrap button[type="submit"]'
+LOGIN_POST_URL_PART: Final[str] = 'nidlogin.login'  # 로그인 폼이 POST 하는 주소(성능 로그에서 응답 감지용)
 
 # 로그인 성공 후 닉네임/이메일
 NICK_CONTAINER_CSS: Final[str] = 'div.MyView-module__user_desc___UWPUY'
 NICK_TEXT_CSS: Final[str] = 'div.MyView-module__user_desc___UWPUY span.MyView-module__nickname___fcxwI'
 EMAIL_CSS: Final[str] = 'div.MyView-module__desc_email___JwAKa'
+# page_source 를 한 번에 파싱할 때 쓰는 클래스 토큰 (위 선택자의 마지막 클래스)
+NICK_TEXT_CLASS: Final[str] = 'MyView-module__nickname___fcxwI'
+EMAIL_CLASS: Final[str] = 'MyView-module__desc_email___JwAKa'
+
+# input 요소의 네이티브 value setter 로 값을 넣고 input/change 이벤트를 발생시키는 스크립트
+# (React 등 프레임워크가 감싼 value 프로퍼티를 우회해 프레임워크 상태에도 반영되도록 함)
+JS_SET_INPUT_VALUE: Final[str] = '''
+const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+setter.call(arguments[0], arguments[1]);
+arguments[0].dispatchEvent(new Event('input', {bubbles: true}));
+arguments[0].dispatchEvent(new Event('change', {bubbles: true}));
+return arguments[0].value;
+'''
+
+# 브라우저의 Clipboard API 로 클립보드에 쓰는 비동기 스크립트 (성공 여부를 콜백으로 반환)
+# Clipboard API 는 보안 컨텍스트(HTTPS)에서만 쓸 수 있으므로, 그 밖에서는 false 를 돌려준다.
+JS_CLIPBOARD_WRITE: Final[str] = '''
+const done = arguments[arguments.length - 1];
+if (!window.isSecureContext || !navigator.clipboard) {
+    done(false);
+    return;
+}
+navigator.clipboard.writeText(arguments[0]).then(() => done(true), () => done(false));
+'''
+PASTE_WAIT_SEC: Final[float] = 2  # 붙여넣기 후 값이 들어올 때까지 기다리는 최대 시간
+PASTE_POLL_SEC: Final[float] = 0.05
+# 붙여넣기 전에 입력칸 포커스 + 전체 선택을 한 번에 처리하는 스크립트
+JS_FOCUS_AND_SELECT: Final[str] = 'arguments[0].focus(); arguments[0].select();'
+
+# 배지 라벨 → 숫자 텍스트를 브라우저 안에서 한 번에 모아 반환하는 스크립트
+# (라벨 span 뒤에 오는 첫 번째 item_num span 을 숫자로 사용)
+BADGE_COUNTS_JS: Final[str] = '''
+const counts = {};
+document.querySelectorAll('span[class*="MyView-module__item_text"]').forEach((el) => {
+    let num = el.nextElementSibling;
+    while (num && !(num.tagName === 'SPAN' && num.className.includes('MyView-module__item_num'))) {
+        num = num.nextElementSibling;
+    }
+    if (num) {
+        counts[el.textContent.trim()] = num.innerText.trim();
+    }
+});
+return counts;
+'''
 
 
 # ================= 공통 유틸 =================
 def setup_driver() -> webdriver.Chrome:
+    from selenium import webdriver
+
     print('[STEP] 브라우저 시작')
     opts = webdriver.ChromeOptions()
     if HEADLESS:
@@ -110,39 +186,68 @@ def setup_driver() -> webdriver.Chrome:
     opts.add_argument('--disable-gpu')
     opts.add_argument('--no-sandbox')
     opts.add_argument('--window-size=1400,1000')
-    drv = webdriver.Chrome(options=opts)  # Selenium Manager
-    drv.implicitly_wait(2)
-    return drv
+    opts.add_argument(f'--user-data-dir={CHROME_PROFILE_DIR}')
+    opts.add_argument('--profile-directory=Default')
+    # DevTools Network 이벤트를 성능 로그로 받아 로그인 POST 응답을 바로 감지하기 위함
+    opts.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    # 암묵적 대기는 명시적 대기(WebDriverWait)와 섞이면 대기 시간이 겹쳐 늘어나므로 사용하지 않음
+    return webdriver.Chrome(options=opts)  # Selenium Manager
+
+
+def write_clipboard(driver: webdriver.Chrome, text: str) -> None:
+    """
+    브라우저의 navigator.clipboard.writeText 로 클립보드 설정.
+    보안 컨텍스트가 아니거나 권한이 없어 실패하면 win_clipboard.set_clipboard 로 폴백.
+    """
+    try:
+        if driver.execute_async_script(JS_CLIPBOARD_WRITE, text):
+            return
+    except Exception:
+        pass
+    set_clipboard(text)
+
+
+def wait_for_value(driver: webdriver.Chrome, element) -> str:
+    """붙여넣기 후 고정 대기 대신, 값이 채워지는 즉시 반환(최대 PASTE_WAIT_SEC, 없으면 빈 문자열)."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        return WebDriverWait(driver, PASTE_WAIT_SEC, poll_frequency=PASTE_POLL_SEC).until(
+            lambda d: element.get_attribute('value')
+        )
+    except TimeoutException:
+        return ''
+
+
+def select_all_and_paste(driver: webdriver.Chrome, element) -> None:
+    """
+    스크립트로 입력칸에 포커스를 주고 기존 내용을 선택한 뒤(클릭/Ctrl+A 없이 한 번에 확실히),
+    Ctrl+V 한 번만 키 입력으로 보낸다.
+    포커스가 늦게 잡혀 붙여넣기가 비는 경우를 없애, 재시도 경로로 빠지는 일을 줄인다.
+    """
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.common.keys import Keys
+
+    driver.execute_script(JS_FOCUS_AND_SELECT, element)
+    ActionChains(driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
 
 
 def paste_via_clipboard(driver: webdriver.Chrome, element, text: str, label: str) -> None:
     try:
         print(f'[CLIP] {label}: 클립보드 설정 시도')
-        set_clipboard(text)
+        write_clipboard(driver, text)
         print(f'[CLIP] {label}: 클립보드 설정 완료')
 
-        element.click()
-        actions = ActionChains(driver)
-        actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
-        time.sleep(0.15)
-
-        actions = ActionChains(driver)
-        actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+        select_all_and_paste(driver, element)
         print(f'[PASTE] {label}: 붙여넣기 수행')
-        time.sleep(0.3)
 
-        val = element.get_attribute('value') or ''
+        val = wait_for_value(driver, element)
         if not val:
             print(f'[WARN] {label}: 비어 있음 → 재시도')
-            set_clipboard(text)
-            element.click()
-            actions = ActionChains(driver)
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
-            time.sleep(0.1)
-            actions = ActionChains(driver)
-            actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
-            time.sleep(0.3)
-            val = element.get_attribute('value') or ''
+            write_clipboard(driver, text)
+            select_all_and_paste(driver, element)
+            val = wait_for_value(driver, element)
 
         print(f'[OK] {label}: 길이={len(val)}')
     except Exception as e:
@@ -151,39 +256,103 @@ def paste_via_clipboard(driver: webdriver.Chrome, element, text: str, label: str
         raise
 
 
+def js_paste(driver: webdriver.Chrome, element, text: str, label: str) -> None:
+    """
+    클립보드/키 입력 없이 스크립트 한 번으로 input 값을 설정(--js-input).
+    자동 입력 감지(2차 인증)가 걸리면 기본 경로(paste_via_clipboard)를 사용할 것.
+    """
+    try:
+        val = driver.execute_script(JS_SET_INPUT_VALUE, element, text) or ''
+        print(f'[OK] {label}: 스크립트 입력 길이={len(val)}')
+    except Exception as e:
+        print(f'[FAIL] {label}: 스크립트 입력 중 예외: {e!r}')
+        save_debug(driver, f'js_paste_fail_{label}')
+        raise
+
+
+def login_response_received():
+    """
+    로그인 POST(nidlogin.login) 의 응답(200 또는 302 리다이렉트)이 성능 로그에 나타나면 True 를 돌려주는 대기 조건.
+    DOM 변화를 폴링하지 않고, 브라우저가 받은 Network 이벤트로 로그인 응답을 바로 감지한다.
+    성능 로그를 쓸 수 없으면 항상 False 이므로 다른 조건(EC.any_of)으로 대기가 끝난다.
+    """
+    post_ids: set[str] = set()
+
+    def _condition(driver) -> bool:
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return False
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            method = message.get('method')
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent':
+                # 302 응답은 responseReceived 없이 같은 requestId 의 redirectResponse 로만 온다
+                if request_id in post_ids and params.get('redirectResponse'):
+                    return True
+                request = params.get('request', {})
+                if request.get('method') == 'POST' and LOGIN_POST_URL_PART in request.get('url', ''):
+                    post_ids.add(request_id)
+            elif method == 'Network.responseReceived' and request_id in post_ids:
+                if params.get('response', {}).get('status') in (200, 302):
+                    return True
+        return False
+
+    return _condition
+
+
 # ================= 기존 V3 기능들 (유지) =================
 def enter_credentials_with_clipboard_and_submit(driver: webdriver.Chrome) -> None:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     try:
         print('[STEP] 로그인 페이지 진입')
         driver.get(NAVER_LOGIN_URL)
         print(f'[OK] 현재 URL: {driver.current_url}')
 
+        # 하나의 WebDriverWait 를 재사용
+        wait = WebDriverWait(driver, DEFAULT_WAIT_SEC, poll_frequency=DEFAULT_POLL_SEC)
+
         print('[STEP] 아이디/비밀번호 입력 필드 대기')
-        id_input = WebDriverWait(driver, DEFAULT_WAIT_SEC).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, LOGIN_ID_INPUT_CSS))
-        )
-        pw_input = WebDriverWait(driver, DEFAULT_WAIT_SEC).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, LOGIN_PW_INPUT_CSS))
+        id_input, pw_input = wait.until(
+            EC.all_of(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, LOGIN_ID_INPUT_CSS)),
+                EC.visibility_of_element_located((By.CSS_SELECTOR, LOGIN_PW_INPUT_CSS)),
+            )
         )
 
-        print('[STEP] 아이디 붙여넣기(클립보드)')
-        paste_via_clipboard(driver, id_input, NAVER_ID, 'ID')
+        fill, how = (js_paste, '스크립트') if JS_INPUT else (paste_via_clipboard, '클립보드')
 
-        print('[STEP] 비밀번호 붙여넣기(클립보드)')
-        paste_via_clipboard(driver, pw_input, NAVER_PW, 'PW')
+        print(f'[STEP] 아이디 붙여넣기({how})')
+        fill(driver, id_input, NAVER_ID, 'ID')
+
+        print(f'[STEP] 비밀번호 붙여넣기({how})')
+        fill(driver, pw_input, NAVER_PW, 'PW')
 
         print('[STEP] 로그인 버튼 대기')
-        submit_btn = WebDriverWait(driver, DEFAULT_WAIT_SEC).until(
+        submit_btn = wait.until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, LOGIN_SUBMIT_BTN_CSS))
         )
 
+        # 로그인 페이지 로딩 중 쌓인 성능 로그는 버리고, 클릭 이후의 응답만 본다
+        login_responded = login_response_received()
+        try:
+            driver.get_log('performance')
+        except Exception:
+            pass
+
         print('[STEP] 로그인 버튼 클릭')
         submit_btn.click()
         print('[OK] 로그인 버튼 클릭')
 
         print('[WAIT] 로그인 응답 대기')
-        WebDriverWait(driver, DEFAULT_WAIT_SEC).until(
+        wait.until(
             EC.any_of(
+                login_responded,
                 EC.url_contains('www.naver.com'),
                 EC.staleness_of(submit_btn),
                 EC.invisibility_of_element_located((By.CSS_SELECTOR, LOGIN_SUBMIT_BTN_CSS))
@@ -196,7 +365,30 @@ def enter_credentials_with_clipboard_and_submit(driver: webdriver.Chrome) -> Non
         raise
 
 
+def is_logged_in(driver: webdriver.Chrome) -> bool:
+    """네이버 첫 화면을 열어, 저장된 프로필의 쿠키로 이미 로그인되어 있는지(닉네임 영역 표시) 확인."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    print('[STEP] 저장된 로그인 상태 확인')
+    driver.get(NAVER_HOME_URL)
+    try:
+        WebDriverWait(driver, LOGIN_PROBE_SEC, poll_frequency=DEFAULT_POLL_SEC).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, NICK_CONTAINER_CSS))
+        )
+    except TimeoutException:
+        return False
+    return True
+
+
 def bypass_device_registration(driver) -> None:
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     print('[STEP] 기기등록 화면 감지')
     try:
         WebDriverWait(driver, 5).until(
@@ -231,8 +423,69 @@ def bypass_device_registration(driver) -> None:
         # 계속 진행
 
 
+class ClassTextParser(HTMLParser):
+    """
+    HTML 을 한 번 훑으면서, 지정한 class 토큰을 가진 첫 요소의 텍스트를 key 별로 모은다.
+    (셀레니움 요소 조회를 반복하지 않고 page_source 한 번으로 여러 값을 뽑기 위함)
+    """
+    VOID_TAGS = frozenset({
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+        'link', 'meta', 'source', 'track', 'wbr',
+    })
+
+    def __init__(self, targets: dict[str, str]) -> None:
+        super().__init__()
+        self.targets = targets
+        self.found: dict[str, str] = {}
+        self._open: list[tuple[str, int, list[str]]] = []  # (key, 깊이, 텍스트 조각)
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag in self.VOID_TAGS:
+            return
+        self._depth += 1
+        classes = (dict(attrs).get('class') or '').split()
+        for key, token in self.targets.items():
+            if key in self.found or any(k == key for k, _, _ in self._open):
+                continue
+            if token in classes:
+                self._open.append((key, self._depth, []))
+
+    def handle_endtag(self, tag) -> None:
+        if tag in self.VOID_TAGS:
+            return
+        for item in [o for o in self._open if o[1] == self._depth]:
+            key, _, chunks = item
+            self.found[key] = ' '.join(''.join(chunks).split())
+            self._open.remove(item)
+        self._depth -= 1
+
+    def handle_data(self, data) -> None:
+        for _, _, chunks in self._open:
+            chunks.append(data)
+
+
 def print_nickname_if_present(driver: webdriver.Chrome) -> None:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     print('[STEP] 닉네임/이메일 영역 탐색')
+
+    # 1) 렌더링이 끝난 상태라면 page_source 한 번으로 닉네임/이메일을 함께 추출
+    try:
+        parser = ClassTextParser({'nickname': NICK_TEXT_CLASS, 'email': EMAIL_CLASS})
+        parser.feed(driver.page_source)
+        nickname = parser.found.get('nickname')
+        email_text = parser.found.get('email')
+        if nickname and email_text:
+            print(f'[OK] 닉네임: {nickname}')
+            print(f'[OK] 이메일: {email_text}')
+            return
+    except Exception:
+        pass
+
+    # 2) 아직 렌더링 중(SPA)이면 요소가 보일 때까지 대기
     try:
         WebDriverWait(driver, DEFAULT_WAIT_SEC).until(
             EC.visibility_of_element_located((By.CSS_SELECTOR, NICK_CONTAINER_CSS))
@@ -259,39 +512,63 @@ def print_nickname_if_present(driver: webdriver.Chrome) -> None:
 
 
 def get_badge_count(driver, label_texts: list[str]) -> None:
-    for label_text in label_texts:
-        xpath = (
-            "//span[contains(@class,'MyView-module__item_text') and normalize-space()=$label]"
-            "/following-sibling::span[contains(@class,'MyView-module__item_num')][1]"
-        ).replace("$label", f"'{label_text}'")
+    """
+    모든 배지(라벨 → 숫자)를 스크립트 한 번으로 가져와, 요청한 라벨만 골라 출력.
+    라벨마다 XPath 대기를 따로 돌리지 않고, 요청한 라벨이 모두 나타날 때까지 같은 스크립트로 폴링한다.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
 
-        try:
-            el = WebDriverWait(driver, DEFAULT_WAIT_SEC).until(
-                EC.visibility_of_element_located((By.XPATH, xpath))
-            )
-            raw = (el.text or "").strip()
-            normalized = raw.replace(",", "")
-            if normalized.endswith("+"):
-                normalized = normalized[:-1]
+    wanted = set(label_texts)
+    counts: dict[str, str] = {}
+
+    def _all_badges_loaded(d) -> bool:
+        counts.clear()
+        counts.update(d.execute_script(BADGE_COUNTS_JS) or {})
+        return wanted <= counts.keys()
 
-            if normalized.isdigit():
-                print(f"{label_text} 알림: {int(normalized)}")
-            else:
-                print(f"{label_text} 알림: {raw if raw else '없음'}")
-        except Exception as e:
-            print(f"[WARN] {label_text} 배지 탐색 실패: {e!r}")
-            save_debug(driver, f'badge_fail_{label_text}')
-            print(f"{label_text} 알림: 없음")
+    try:
+        WebDriverWait(driver, DEFAULT_WAIT_SEC, poll_frequency=DEFAULT_POLL_SEC).until(_all_badges_loaded)
+    except Exception as e:
+        missing = ', '.join(label for label in label_texts if label not in counts)
+        print(f"[WARN] {missing} 배지 탐색 실패: {e!r}")
+        save_debug(driver, 'badge_fail')
+
+    for label_text in label_texts:
+        raw = (counts.get(label_text) or "").strip()
+        normalized = raw.replace(",", "")
+        if normalized.endswith("+"):
+            normalized = normalized[:-1]
+
+        if normalized.isdigit():
+            print(f"{label_text} 알림: {int(normalized)}")
+        else:
+            print(f"{label_text} 알림: {raw if raw else '없음'}")
 
 
 # ================= 추가: 세션 이관 + 쿠키 저장 + 메일 API 호출 =================
-def session_from_selenium(driver: webdriver.Chrome) -> requests.Session:
+def session_from_selenium(driver: webdriver.Chrome, cookies: list[dict] | None = None) -> requests.Session:
     """
     Selenium 브라우저에서 네이버 관련 쿠키를 모두 뽑아 requests.Session에 이식하고
     브라우저 UA로 맞춘다. (이 세션은 곧바로 재사용)
+    cookies 로 이미 받아 둔 driver.get_cookies() 결과를 넘기면 브라우저에 다시 묻지 않는다.
     """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
     print('[STEP] 세션 이관: Selenium → requests.Session')
     sess = requests.Session()
+    # 워밍업 GET 과 메일 목록 POST 가 같은 keep-alive 연결(TLS 세션)을 재사용하도록 풀 크기를 지정
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=HTTP_RETRY_TOTAL,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=HTTP_RETRY_STATUSES,
+        ),
+    )
+    sess.mount('https://', adapter)
 
     # UA 복제
     try:
@@ -302,7 +579,9 @@ def session_from_selenium(driver: webdriver.Chrome) -> requests.Session:
 
     # 쿠키 이식
     copied = 0
-    for c in driver.get_cookies():
+    if cookies is None:
+        cookies = driver.get_cookies()
+    for c in cookies:
         dom = c.get('domain', '')
         if 'naver.com' in dom:
             sess.cookies.set(
@@ -316,20 +595,24 @@ def session_from_selenium(driver: webdriver.Chrome) -> requests.Session:
     return sess
 
 
-def save_selenium_cookies_json(driver: webdriver.Chrome, path: str = 'selenium_cookies.json') -> None:
-    """Selenium 쿠키를 JSON 파일로 저장."""
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(driver.get_cookies(), f, ensure_ascii=False, indent=2)
+def save_selenium_cookies_json(cookies: list[dict], path: str = 'selenium_cookies.json') -> None:
+    """Selenium 쿠키(driver.get_cookies() 결과)를 JSON 파일로 저장(직렬화 후 한 번에 기록)."""
+    if orjson is not None:
+        data = orjson.dumps(cookies, option=orjson.OPT_INDENT_2)
+    else:
+        # indent 를 주면 표준 json 은 C 인코더를 쓰지 못하므로, 폴백은 공백 없는 한 줄로 저장
+        data = json.dumps(cookies, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
     print(f'[OK] Selenium 쿠키 저장: {path}')
 
 
-def save_requests_cookies_lwp(sess: requests.Session, path: str = 'requests_cookies.lwp') -> None:
-    """requests 세션 쿠키를 LWP 포맷으로 저장(표준 라이브러리 CookieJar)."""
+def save_requests_cookies_lwp(cookies: requests.cookies.RequestsCookieJar, path: str = 'requests_cookies.lwp') -> None:
+    """requests 세션 쿠키(jar)를 LWP 포맷으로 저장(표준 라이브러리 CookieJar)."""
     jar = LWPCookieJar()
-    # session.cookies(RequestsCookieJar) → LWPCookieJar로 복사
-    for c in sess.cookies:
-        # LWPCookieJar에 직접 쿠키 추가
-        jar.set_cookie(c)
+    # RequestsCookieJar 도 표준 CookieJar 이므로 {도메인: {경로: {이름: Cookie}}} 내부 dict 를 그대로 넘긴다.
+    # (쿠키마다 set_cookie 로 다시 색인하지 않음. save 는 읽기만 하므로 원본 jar 를 바꾸지 않는다)
+    jar._cookies = cookies._cookies
     jar.save(path, ignore_discard=True, ignore_expires=True)
     print(f'[OK] requests 쿠키 저장: {path}')
 
@@ -348,6 +631,8 @@ def fetch_mail_page1(sess: requests.Session, user_id: str) -> list[dict]:
     POST https://mail.naver.com/json/list ...
     1페이지 mailData의 subject, receivedTime(raw/해석)을 리스트[dict]로 반환.
     """
+    from urllib3.util.request import ACCEPT_ENCODING
+
     print('[STEP] 메일 목록 1페이지 요청(POST)')
     url = 'https://mail.naver.com/json/list'
     params = {
@@ -362,37 +647,54 @@ def fetch_mail_page1(sess: requests.Session, user_id: str) -> list[dict]:
     headers = {
         'Referer': 'https://mail.naver.com/',
         'Accept': 'application/json',
+        # urllib3 가 디코딩할 수 있는 압축 방식만 요청 (brotli 패키지가 있으면 br 포함)
+        'Accept-Encoding': ACCEPT_ENCODING,
     }
     r = sess.post(url, params=params, headers=headers, timeout=15)
     r.raise_for_status()
     data = r.json()
 
-    mail_data = data.get('mailData', []) or []
+    mail_data = data.get('mailData') or []
     print(f'[OK] 메일 항목 수: {len(mail_data)}')
 
-    kst = timezone(timedelta(hours=9))
     results: list[dict] = []
     for item in mail_data:
-        subject = item.get('subject') or ''
         recv_raw = item.get('receivedTime', None)
-        if isinstance(recv_raw, int):
-            recv_local = datetime.fromtimestamp(recv_raw, tz=kst).strftime('%Y-%m-%d %H:%M:%S %Z')
-        else:
-            recv_local = None
         results.append({
-            'subject': subject,
+            'subject': item.get('subject') or '',
             'receivedTime_raw': recv_raw,
-            'receivedTime_local': recv_local,
+            'receivedTime_local': _format_kst(recv_raw) if isinstance(recv_raw, int) else None,
         })
     return results
 
 
+def _format_kst(epoch_sec: int) -> str:
+    """UNIX 초를 'YYYY-MM-DD HH:MM:SS UTC+09:00' (KST) 문자열로 변환."""
+    tm = time.gmtime(epoch_sec + KST_OFFSET_SEC)
+    return KST_TIME_FORMAT % (tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec)
+
+
+def dump_mail_list(mail_list: list[dict], pretty: bool) -> str:
+    """
+    메일 목록을 JSON 문자열로 직렬화.
+    기본은 공백 없는 한 줄(표준 json 의 C 인코더 사용), pretty 면 들여쓰기(orjson 이 있으면 orjson 사용).
+    """
+    if not pretty:
+        return json.dumps(mail_list, ensure_ascii=False, separators=(',', ':'))
+    if orjson is not None:
+        return orjson.dumps(mail_list, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(mail_list, ensure_ascii=False, indent=2)
+
+
 # ================= 메인 흐름 =================
 def main() -> None:
     parser = argparse.ArgumentParser(description='Naver login + requests 세션 이관 + 메일 API 호출')
     parser.add_argument('--id', dest='naver_id', default=None, help='Naver ID (미지정 시 코드 상수 사용)')
     parser.add_argument('--pw', dest='naver_pw', default=None, help='Naver PW (미지정 시 코드 상수 사용)')
     parser.add_argument('--headless', action='store_true', help='Headless 모드')
+    parser.add_argument('--js-input', action='store_true', help='클립보드 대신 스크립트로 ID/PW 입력(빠르지만 자동 입력 감지에 걸릴 수 있음)')
+    parser.add_argument('--force-login', action='store_true', help='저장된 로그인 상태가 있어도 다시 로그인')
+    parser.add_argument('--pretty', action='store_true', help='메일 목록 JSON을 들여쓰기해서 출력(기본: 한 줄)')
     args = parser.parse_args()
 
     # 인자로 전달되면 상수 덮어쓰기
@@ -402,27 +704,45 @@ def main() -> None:
         globals()['NAVER_PW'] = args.naver_pw
     if args.headless:
         globals()['HEADLESS'] = True
+    if args.js_input:
+        globals()['JS_INPUT'] = True
 
     driver = setup_driver()
     try:
-        # 1) 로그인(+기기등록 우회) — 기존 로직 유지
-        enter_credentials_with_clipboard_and_submit(driver)
-        bypass_device_registration(driver)
+        # 1) 로그인(+기기등록 우회) — 이전 실행의 프로필로 이미 로그인되어 있으면 생략
+        if not args.force_login and is_logged_in(driver):
+            print('[OK] 저장된 로그인 상태 사용 → 로그인 생략')
+        else:
+            enter_credentials_with_clipboard_and_submit(driver)
+            bypass_device_registration(driver)
         print_nickname_if_present(driver)
         get_badge_count(driver, ['메일', '카페'])
 
-        # 2) 세션 이관 + 쿠키 저장
-        sess = session_from_selenium(driver)
-        save_selenium_cookies_json(driver, 'selenium_cookies.json')
-        save_requests_cookies_lwp(sess, 'requests_cookies.lwp')
-
-        # 3) mail.naver.com 워밍업 후 메일 1페이지 수집
-        warm_up_mail(sess)
+        # 2) 세션 이관
+        # 브라우저 쿠키는 한 번만 받아 세션 이관과 JSON 저장에 함께 사용
+        cookies = driver.get_cookies()
+        sess = session_from_selenium(driver, cookies)
+
+        # 3) 쿠키 파일 저장(디스크 I/O)과 mail.naver.com 워밍업(네트워크 I/O)은 서로 독립이므로 동시에 수행.
+        #    워밍업 응답이 세션 쿠키를 바꾸므로, LWP 저장은 이관 직후의 쿠키 사본으로 한다.
+        cookie_snapshot = sess.cookies.copy()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(save_selenium_cookies_json, cookies, 'selenium_cookies.json'),
+                pool.submit(save_requests_cookies_lwp, cookie_snapshot, 'requests_cookies.lwp'),
+                pool.submit(warm_up_mail, sess),
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        # 4) 메일 1페이지 수집
         mail_list = fetch_mail_page1(sess, globals()['NAVER_ID'])
 
-        # 4) 리스트[dict] 출력 (요청사항: 리스트에 json 형태로 저장 후 화면 표기)
+        # 5) 리스트[dict] 출력 (요청사항: 리스트에 json 형태로 저장 후 화면 표기)
         print('=== 메일 1페이지 (subject, receivedTime_raw, receivedTime_local) ===')
-        print(json.dumps(mail_list, ensure_ascii=False, indent=2))
+        sys.stdout.write(dump_mail_list(mail_list, args.pretty))
+        sys.stdout.write('\n')
+        sys.stdout.flush()
 
     finally:
         print('[STEP] 브라우저 종료')
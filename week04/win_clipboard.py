@@ -2,41 +2,54 @@
 from __future__ import annotations
 
 import platform
-import subprocess
 import time
 import ctypes
 from ctypes import wintypes
 
 
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+
+# DLL 핸들은 import 시 한 번만 얻어 두고 호출마다 재사용
+if platform.system() == 'Windows':
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+
+    # 함수 시그니처를 한 번만 선언해 두면 호출마다 기본 인자 변환을 거치지 않고,
+    # 64비트에서 핸들/포인터 반환값이 int(32비트)로 잘리는 문제도 막을 수 있음
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.argtypes = []
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.CloseClipboard.argtypes = []
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+else:
+    user32 = kernel32 = None
+
+
 def set_clipboard(text: str, retries: int = 6, backoff_sec: float = 0.08) -> None:
     """
     Windows에서만 동작. 외부 패키지 없이 클립보드에 텍스트 설정.
-    1) 우선 'clip.exe'로 시도 (가장 안정적)
-    2) 실패 시 ctypes로 CF_UNICODETEXT 설정 + OpenClipboard 재시도
+    clip.exe 프로세스를 띄우지 않고 ctypes로 CF_UNICODETEXT를 직접 설정 + OpenClipboard 재시도
 
     :param text: 클립보드에 넣을 문자열
-    :param retries: OpenClipboard/ctypes 경로 재시도 횟수
+    :param retries: OpenClipboard 재시도 횟수
     :param backoff_sec: 재시도 간 대기 시간(초)
     """
-    if platform.system() != 'Windows':
+    if user32 is None:
         raise RuntimeError('set_clipboard: Windows만 지원합니다.')
 
-    # 1) clip.exe로 시도 (권장 경로)
-    try:
-        # text=True 로 표준 입력 전달; Windows 한글 로케일에서도 안정적으로 동작
-        subprocess.run(['clip'], input=text, text=True, check=True)
-        return
-    except Exception:
-        # clip.exe 이용 실패 시 ctypes 경로로 폴백
-        pass
-
-    # 2) ctypes 경로 (CF_UNICODETEXT)
-    CF_UNICODETEXT = 13
-    GMEM_MOVEABLE = 0x0002
-
-    user32 = ctypes.windll.user32
-    kernel32 = ctypes.windll.kernel32
-
     # 유니코드(UTF-16LE) + 널 종료
     data = text.encode('utf-16le') + b'\x00\x00'
 
@@ -22,15 +22,13 @@ https://myaccount.google.com/apppasswords
 * 참고 : verbose == 진행내역 간략한 로그
 attach == 첨부파일 기입
 
-"""
 
-'''
 sendmail.py
-- python-emails(emails) 라이브러리를 사용하여 SMTP로 메일 전송(평문/HTML/첨부)
+- python-emails(emails) 라이브러리로 메시지(평문/HTML/첨부)를 구성하고, 표준 smtplib 연결로 SMTP 전송
 - Gmail 권장: smtp.gmail.com:587(STARTTLS) 또는 465(SSL)
 - 과제 제약 준수: 메일 관련 외부 패키지(emails)만 사용
 - 문자열은 단일 인용부호 기본, PEP 8 스타일 준수
-'''
+"""
 
 from __future__ import annotations
 
@@ -41,18 +39,24 @@ import mimetypes
 import smtplib
 import ssl
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-try:
+# python-emails 는 import 비용이 커서(requests, lxml 등을 함께 불러옴) 메시지를 만들 때 불러온다.
+# 덕분에 --help 나 인자 오류처럼 바로 끝나는 실행은 기다리지 않는다.
+if TYPE_CHECKING:
     import emails  # python-emails
-except ImportError:
-    print("필요 패키지 'emails'가 없습니다. 먼저 'pip install emails'를 실행하세요.", file=sys.stderr)
-    sys.exit(2)
 
 
 LOG = logging.getLogger('sendmail')
 
+# 첨부 파일을 동시에 읽을 최대 스레드 수
+ATTACH_READ_WORKERS = 8
+
+# MIME 타입 DB는 첫 guess_type 호출 때 지연 로딩되므로 import 시점에 미리 읽어 둔다.
+mimetypes.init()
+
 
 class SmtpConfig:
     '''
@@ -64,26 +68,26 @@ class SmtpConfig:
         self.use_ssl = use_ssl
         self.timeout = timeout
 
-    def to_emails_smtp_dict(self, username: str, password: str) -> dict:
+    def connect(self, username: str, password: str) -> smtplib.SMTP:
         '''
-        python-emails에서 요구하는 smtp 딕셔너리로 변환.
+        SMTP 서버에 접속해 TLS 설정과 로그인까지 마친 연결을 반환.
         - use_ssl True  -> implicit SSL(보통 465)
         - use_ssl False -> STARTTLS(보통 587)
+        한 연결로 여러 메시지를 보낼 수 있으므로, 메일마다 TLS 핸드셰이크/인증을 반복하지 않아도 된다.
         '''
-        smtp_dict: dict = {
-            'host': self.host,
-            'port': self.port,
-            'user': username,
-            'password': password,
-            'timeout': self.timeout,
-        }
+        context = ssl.create_default_context()
         if self.use_ssl:
-            smtp_dict['ssl'] = True
-            smtp_dict['tls'] = False
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout, context=context)
         else:
-            smtp_dict['ssl'] = False
-            smtp_dict['tls'] = True
-        return smtp_dict
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if not self.use_ssl:
+                smtp.starttls(context=context)
+            smtp.login(username, password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
 
     def __repr__(self) -> str:
         return (
@@ -140,6 +144,17 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
     return args
 
 
+def ensure_emails_installed() -> None:
+    '''
+    python-emails 설치 여부 확인(비밀번호를 묻기 전에 미리 확인).
+    '''
+    try:
+        import emails  # noqa: F401
+    except ImportError:
+        print("필요 패키지 'emails'가 없습니다. 먼저 'pip install emails'를 실행하세요.", file=sys.stderr)
+        sys.exit(2)
+
+
 def configure_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(level=level, format='[%(levelname)s] %(message)s')
@@ -202,6 +217,8 @@ def build_message(
     '''
     emails.Message 생성. Bcc는 헤더에 넣지 않고 전송 대상에만 포함한다.
     '''
+    import emails
+
     cc = cc or []
     bcc = bcc or []
 
@@ -225,18 +242,28 @@ def build_message(
 
 
 def add_attachments(msg: emails.Message, paths: Iterable[str]) -> None:
-    for raw in paths:
-        if not raw:
-            continue
-        p = Path(raw)
+    '''
+    첨부 파일들을 동시에 읽은 뒤, 메시지에는 지정한 순서대로 하나씩 첨부한다.
+    (emails.Message 는 스레드 안전하지 않으므로 attach 는 현재 스레드에서만 호출)
+    '''
+    files = [Path(raw) for raw in paths if raw]
+    for p in files:
         if not p.is_file():
             raise FileNotFoundError(f'첨부 파일을 찾을 수 없습니다: {p}')
+    if not files:
+        return
+
+    if len(files) == 1:
+        contents = [files[0].read_bytes()]
+    else:
+        with ThreadPoolExecutor(max_workers=min(ATTACH_READ_WORKERS, len(files))) as pool:
+            contents = list(pool.map(Path.read_bytes, files))
 
+    for p, data in zip(files, contents):
         # MIME 타입 추정(못 찾으면 octet-stream)
         ctype, _ = mimetypes.guess_type(p.name)
         maintype, subtype = ('application', 'octet-stream') if not ctype else ctype.split('/', 1)
 
-        data = p.read_bytes()
         msg.attach(filename=p.name, data=data, maintype=maintype, subtype=subtype)
         LOG.debug('첨부 추가: %s (%s/%s, %d bytes)', p.name, maintype, subtype, len(data))
 
@@ -247,17 +274,21 @@ def send_via_emails(
     password: str,
     config: SmtpConfig,
     recipients: List[str],
-) -> object:
+    smtp: Optional[smtplib.SMTP] = None,
+) -> dict:
     '''
-    python-emails의 send 호출. 성공 시 응답 객체를 반환.
+    smtplib 연결로 메시지 전송. 성공 시 거부된 수신자 딕셔너리(모두 성공이면 빈 dict)를 반환.
+    smtp 연결을 넘기면 그 연결을 재사용하고, 없으면 이번 전송을 위해 접속했다가 닫는다.
     '''
-    smtp_dict = config.to_emails_smtp_dict(username=username, password=password)
-    LOG.debug('SMTP 설정: %s', smtp_dict)
+    # Bcc는 헤더에 넣지 않고 recipients(봉투 수신자)에만 포함되어야 한다.
+    _, mail_from = msg.mail_from
+    data = msg.as_string()
+    if smtp is not None:
+        return smtp.sendmail(mail_from, recipients, data)
 
-    # Bcc는 헤더에 넣지 않고 recipients에만 포함되어야 한다.
-    # emails.Message.send는 'to' 인자에 전체 수신자 리스트를 넘겨주면 된다.
-    response = msg.send(to=recipients, smtp=smtp_dict)
-    return response
+    LOG.debug('SMTP 설정: %s', config)
+    with config.connect(username=username, password=password) as conn:
+        return conn.sendmail(mail_from, recipients, data)
 
 
 def main(argv: Optional[Iterable[str]] = None) -> int:
@@ -265,6 +296,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     ## 0단계 - 실행 매개변수 분리하여 저장하기
     args = parse_args(argv)
     configure_logging(args.verbose)
+    ensure_emails_installed()
 
     sender = args.sender or args.username
     to = split_address_args(args.to)
@@ -315,7 +347,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
 
     recipients = [*to, *cc, *bcc]
 
-    ## 4단계(완) - python-emails의 send 메소드를 이용, 구현한 emails.Message를 기반하여 메일을 전송한다. 전송 시, 기입한 2차 비밀번호 이용.
+    ## 4단계(완) - smtplib 연결로 로그인한 뒤, 구현한 emails.Message를 기반하여 메일을 전송한다. 전송 시, 기입한 2차 비밀번호 이용.
     try:
         resp = send_via_emails(
             msg=msg,
@@ -324,12 +356,10 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             config=cfg,
             recipients=recipients,
         )
-        # 응답 객체는 구현에 따라 status_code 속성을 가질 수 있음
-        code = getattr(resp, 'status_code', None)
-        if code is not None:
-            LOG.info('메일 전송 완료(status_code=%s)', code)
-        else:
-            LOG.info('메일 전송 완료')
+        # 일부 수신자만 거부된 경우 거부 목록이 반환됨
+        if resp:
+            LOG.warning('일부 수신자 거부: %s', resp)
+        LOG.info('메일 전송 완료')
         return 0
     except smtplib.SMTPAuthenticationError as exc:
         LOG.error('인증 실패: Gmail 2단계 인증 후 발급한 "앱 비밀번호"를 사용하세요. (%s)', exc)
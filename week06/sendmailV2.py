@@ -31,6 +31,7 @@
 --mode        : 'loop'(개별 발송, 기본) | 'bcc'(Bcc 동시 발송)
 --dry-run     : 실제 전송 없이 CSV/템플릿 파싱 및 치환·요약만 수행
 --chunk-size  : bcc 모드에서 한 번에 묶을 수신자 수(기본 50)
+--workers     : loop 모드에서 동시에 여는 SMTP 연결(발송 스레드) 수(기본 4)
 
 주의
 - loop 모드만 개인화 치환({name}) 적용.
@@ -40,16 +41,23 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import csv
 import getpass
 import logging
 import mimetypes
+import queue
 import re
 import smtplib
 import ssl
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Dict, Optional, Tuple
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, TypeVar
 
 try:
     import emails  # python-emails
@@ -57,19 +65,42 @@ except ImportError:
     print("필요 패키지 'emails'가 없습니다. 먼저 'pip install emails'를 실행하세요.", file=sys.stderr)
     sys.exit(2)
 
+try:
+    # 설치되어 있으면 CSV 앞부분으로 인코딩을 먼저 추정해, 실패할 디코딩 시도를 건너뛴다
+    from charset_normalizer import from_bytes as sniff_charset
+except ImportError:
+    sniff_charset = None
+
 
 LOG = logging.getLogger('sendmail')
-EMAIL_REGEX = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+# 인코딩 감지 시 한 번에 읽을 문자 수
+CSV_DETECT_CHUNK = 1 << 20
+# charset_normalizer 로 인코딩을 추정할 때 읽을 앞부분 크기(바이트)
+CSV_SNIFF_BYTES = 64 * 1024
+# 쉼표로 구분된 주소 하나(앞뒤 공백 제외, 이름 <주소> 안의 공백은 유지)
+ADDRESS_TOKEN_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+# 일시적 거부(발송 속도 제한 등)로 보고 잠시 후 다시 보내 볼 SMTP 응답 코드
+SMTP_RETRY_CODES = frozenset({421, 450, 451, 452})
+SMTP_RETRY_MAX = 3
+SMTP_RETRY_BACKOFF_SEC = 2.0
+
+T = TypeVar('T')
+# load_attachments() 결과 한 건: (파일명, 데이터, maintype, subtype)
+Attachment = Tuple[str, bytes, str, str]
+# iter_csv() 결과 한 건: (이름, 이메일)
+Target = Tuple[str, str]
 
 
 # -----------------------------
 # 경로/인코딩 유틸
 # -----------------------------
+@lru_cache(maxsize=256)
 def resolve_resource_path(raw: Optional[str]) -> Optional[str]:
     """파일 경로를 안전하게 해석한다.
     - 주어진 경로가 그대로 존재하면 사용
     - 없으면 스크립트 파일의 폴더 기준으로 재탐색
     - 파일명만 주어진 경우에도 스크립트 폴더에서 탐색
+    - 같은 경로를 여러 번 해석해도 stat() 을 반복하지 않도록 결과를 캐시한다(실패는 캐시하지 않음)
     """
     if not raw:
         return None
@@ -92,7 +123,8 @@ def resolve_resource_path(raw: Optional[str]) -> Optional[str]:
     raise FileNotFoundError(f'파일을 찾을 수 없습니다: {raw} (시도: {alt}, {alt2})')
 
 
-def candidate_encodings(preferred: Optional[str]) -> List[str]:
+@lru_cache(maxsize=16)
+def candidate_encodings(preferred: Optional[str]) -> Tuple[str, ...]:
     order = [preferred or 'utf-8-sig', 'utf-8-sig', 'utf-8', 'cp949', 'euc-kr', 'utf-16']
     seen: set[str] = set()
     out: List[str] = []
@@ -100,7 +132,7 @@ def candidate_encodings(preferred: Optional[str]) -> List[str]:
         if enc and enc not in seen:
             out.append(enc)
             seen.add(enc)
-    return out
+    return tuple(out)
 
 
 # -----------------------------
@@ -113,26 +145,94 @@ class SmtpConfig:
         self.use_ssl = use_ssl
         self.timeout = timeout
 
-    def to_emails_smtp_dict(self, username: str, password: str) -> dict:
-        cfg = {
-            'host': self.host,
-            'port': self.port,
-            'user': username,
-            'password': password,
-            'timeout': self.timeout,
-        }
-        if self.use_ssl:
-            cfg['ssl'] = True
-            cfg['tls'] = False
-        else:
-            cfg['ssl'] = False
-            cfg['tls'] = True
-        return cfg
-
     def __repr__(self) -> str:
         return f'SmtpConfig(host={self.host!r}, port={self.port!r}, use_ssl={self.use_ssl!r}, timeout={self.timeout!r})'
 
 
+class SmtpSession:
+    """SMTP 연결 하나를 열어 로그인한 뒤, 여러 메시지 전송에 재사용한다(with 문으로 사용).
+    - 첫 전송 시점에 접속하므로 dry-run 에서는 접속하지 않는다.
+    - 서버가 연결을 끊으면(유휴 타임아웃 등) 재접속 후 한 번 다시 보낸다.
+    """
+    def __init__(self, config: SmtpConfig, username: str, password: str) -> None:
+        self.config = config
+        self.username = username
+        self.password = password
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def __enter__(self) -> 'SmtpSession':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def connect(self) -> None:
+        self.close()
+        cfg = self.config
+        context = ssl.create_default_context()
+        if cfg.use_ssl:
+            smtp = smtplib.SMTP_SSL(cfg.host, cfg.port, timeout=cfg.timeout, context=context)
+        else:
+            smtp = smtplib.SMTP(cfg.host, cfg.port, timeout=cfg.timeout)
+        try:
+            smtp.ehlo()
+            if not cfg.use_ssl:
+                smtp.starttls(context=context)
+                smtp.ehlo()
+            smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        LOG.debug('SMTP 접속/로그인 완료: %s', cfg)
+        self._smtp = smtp
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def sendmail(self, from_addr: str, rcpts: List[str], data: str) -> dict:
+        if self._smtp is None:
+            self.connect()
+        try:
+            return self._smtp.sendmail(from_addr, rcpts, data)
+        except smtplib.SMTPServerDisconnected:
+            LOG.warning('SMTP 연결이 끊어져 재접속합니다.')
+            self.connect()
+            return self._smtp.sendmail(from_addr, rcpts, data)
+
+
+class SmtpSessionPool:
+    """SmtpSession 여러 개를 큐에 담아 두고, 발송 스레드가 하나씩 빌려 쓰게 한다(with 문으로 사용).
+    세션은 처음 빌려 쓸 때 접속하므로 실제로 쓰인 개수만큼만 로그인한다.
+    """
+    def __init__(self, config: SmtpConfig, username: str, password: str, size: int) -> None:
+        self.size = max(1, size)
+        self._sessions = [SmtpSession(config, username, password) for _ in range(self.size)]
+        self._idle: queue.Queue = queue.Queue()
+        for session in self._sessions:
+            self._idle.put(session)
+
+    def __enter__(self) -> 'SmtpSessionPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for session in self._sessions:
+            session.close()
+
+    @contextmanager
+    def session(self) -> Iterator[SmtpSession]:
+        session = self._idle.get()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+
 # -----------------------------
 # 인자 파싱/로깅
 # -----------------------------
@@ -168,6 +268,7 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
     p.add_argument('--csv', dest='csv_path', default=None, help='CSV 경로(헤더: 이름,이메일)')
     p.add_argument('--mode', choices=['loop', 'bcc'], default='loop', help='loop=개별(권장) | bcc=동시')
     p.add_argument('--chunk-size', type=int, default=50, help='bcc 모드 배치 크기')
+    p.add_argument('--workers', type=int, default=4, help='loop 모드 동시 SMTP 연결 수')
     p.add_argument('--encoding', default='utf-8-sig', help='CSV 기본 인코딩(기본 utf-8-sig)')
 
     # 기타
@@ -191,13 +292,8 @@ def configure_logging(verbose: bool) -> None:
 
 
 def split_address_args(items: Iterable[str]) -> List[str]:
-    out: List[str] = []
-    for it in items:
-        for part in it.split(','):
-            part = part.strip()
-            if part:
-                out.append(part)
-    return out
+    # 인자를 쉼표로 이어 붙인 뒤 정규식 한 번으로 쪼개고 앞뒤 공백을 떼며, 빈 항목은 건너뛴다
+    return ADDRESS_TOKEN_RE.findall(','.join(items))
 
 
 # -----------------------------
@@ -224,43 +320,65 @@ def resolve_bodies(text: Optional[str], text_file: Optional[str], html: Optional
     return text_body, html_body
 
 
+def is_valid_email(addr: str) -> bool:
+    """'x@y.z' 형태인지 정규식 없이 검사한다(백트래킹 없음).
+    - '@' 는 정확히 하나, 앞뒤 모두 비어 있지 않아야 한다.
+    - 도메인에는 맨 앞/맨 뒤가 아닌 위치에 '.' 이 있어야 한다.
+    - 공백 문자가 없어야 한다.
+    """
+    local, at, domain = addr.partition('@')
+    if not local or not at or '@' in domain:
+        return False
+    if domain.find('.', 1, len(domain) - 1) == -1:
+        return False
+    return not any(c.isspace() for c in addr)
+
+
 def normalize_header_name(name: str) -> str:
     return name.strip().lower()
 
 
-def parse_csv(path: str, preferred_encoding: str = 'utf-8-sig') -> List[Dict[str, str]]:
-    targets: List[Dict[str, str]] = []
-    p = Path(resolve_resource_path(path))
-    if not p.exists():
-        raise FileNotFoundError(f'CSV 파일을 찾을 수 없습니다: {path}')
+def sniff_csv_encoding(p: Path, candidates: Tuple[str, ...]) -> Optional[str]:
+    """charset_normalizer 로 파일 앞부분의 인코딩을 추정해, 후보 중 같은 코덱이 있으면 그 이름을 반환한다.
+    utf-8 계열로 추정되면 BOM 처리를 위해 기존 순서(utf-8-sig 우선)를 그대로 쓰도록 None 을 반환한다.
+    """
+    if sniff_charset is None:
+        return None
+    with p.open('rb') as f:
+        best = sniff_charset(f.read(CSV_SNIFF_BYTES)).best()
+    if best is None:
+        return None
+    try:
+        guessed = codecs.lookup(best.encoding).name
+    except LookupError:
+        return None
+    if guessed == 'utf-8':
+        return None
+    for enc in candidates:
+        if codecs.lookup(enc).name == guessed:
+            return enc
+    return None
+
+
+def detect_csv_encoding(p: Path, preferred_encoding: str = 'utf-8-sig') -> str:
+    """후보 인코딩으로 파일 전체를 끝까지 디코딩해 보고, 처음 성공한 인코딩을 반환한다.
+    행을 스트리밍으로 넘기는 도중에 디코딩이 실패해 이미 보낸 행을 다시 보내는 일이 없도록
+    발송 전에 미리 확인하며, 고정 크기로 나눠 읽으므로 메모리는 파일 크기와 무관하다.
+    charset_normalizer 가 있으면 추정한 인코딩부터 확인한다(추정이 틀려도 나머지 후보로 계속 시도).
+    """
+    candidates = candidate_encodings(preferred_encoding)
+    sniffed = sniff_csv_encoding(p, candidates)
+    if sniffed:
+        LOG.debug('CSV 인코딩 추정: %s', sniffed)
+        candidates = (sniffed, *(enc for enc in candidates if enc != sniffed))
 
     last_exc: Optional[Exception] = None
-    for enc in candidate_encodings(preferred_encoding):
+    for enc in candidates:
         try:
             with p.open('r', encoding=enc, newline='') as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    raise ValueError('CSV 헤더가 없습니다. 첫 줄에 "이름,이메일"을 포함하세요.')
-
-                field_map = {normalize_header_name(h): h for h in reader.fieldnames}
-                name_key = field_map.get('이름') or field_map.get('name')
-                email_key = field_map.get('이메일') or field_map.get('email')
-                if not name_key or not email_key:
-                    raise ValueError('CSV 헤더에 "이름,이메일" 또는 "name,email"이 필요합니다.')
-
-                for row in reader:
-                    raw_name = (row.get(name_key) or '').strip()
-                    raw_email = (row.get(email_key) or '').strip().replace(' ', '')
-                    if not raw_name or not raw_email:
-                        LOG.warning('이름/이메일 누락 행 건너뜀: %s', row)
-                        continue
-                    if not EMAIL_REGEX.match(raw_email):
-                        LOG.warning('이메일 형식 오류 건너뜀: %s', raw_email)
-                        continue
-                    targets.append({'name': raw_name, 'email': raw_email})
-
-                LOG.info('CSV 인코딩 감지: %s', enc)
-                return targets
+                while f.read(CSV_DETECT_CHUNK):
+                    pass
+            return enc
         except UnicodeDecodeError as exc:
             last_exc = exc
             continue
@@ -274,6 +392,64 @@ def parse_csv(path: str, preferred_encoding: str = 'utf-8-sig') -> List[Dict[str
     ) from last_exc
 
 
+def iter_csv(path: str, preferred_encoding: str = 'utf-8-sig') -> Iterator[Target]:
+    """CSV 를 한 행씩 읽어 검증된 (이름, 이메일) 튜플을 넘겨주는 이터레이터를 반환한다.
+    파일/인코딩/헤더 오류는 호출 시점에 바로 예외로 알리고, 행은 발송하면서 필요할 때 읽는다.
+    """
+    p = Path(resolve_resource_path(path))
+    if not p.exists():
+        raise FileNotFoundError(f'CSV 파일을 찾을 수 없습니다: {path}')
+
+    enc = detect_csv_encoding(p, preferred_encoding)
+    LOG.info('CSV 인코딩 감지: %s', enc)
+
+    # 행마다 dict 를 만드는 DictReader 대신 csv.reader 로 읽고, 헤더에서 찾은 열 번호로 바로 꺼낸다.
+    f = p.open('r', encoding=enc, newline='')
+    try:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError('CSV 헤더가 없습니다. 첫 줄에 "이름,이메일"을 포함하세요.')
+
+        field_map = {normalize_header_name(h): i for i, h in enumerate(header)}
+        name_idx = field_map.get('이름', field_map.get('name'))
+        email_idx = field_map.get('이메일', field_map.get('email'))
+        if name_idx is None or email_idx is None:
+            raise ValueError('CSV 헤더에 "이름,이메일" 또는 "name,email"이 필요합니다.')
+    except Exception:
+        f.close()
+        raise
+
+    def rows() -> Iterator[Target]:
+        with f:
+            for row in reader:
+                if not row:
+                    # 빈 줄은 DictReader 와 같이 조용히 건너뜀
+                    continue
+                raw_name = row[name_idx].strip() if name_idx < len(row) else ''
+                # 앞뒤/중간의 공백 문자를 split() 한 번으로 모두 제거
+                raw_email = ''.join(row[email_idx].split()) if email_idx < len(row) else ''
+                if not raw_name or not raw_email:
+                    LOG.warning('이름/이메일 누락 행 건너뜀: %s', row)
+                    continue
+                if not is_valid_email(raw_email):
+                    LOG.warning('이메일 형식 오류 건너뜀: %s', raw_email)
+                    continue
+                yield raw_name, raw_email
+
+    return rows()
+
+
+def chunked(iterable: Iterable[T], n: int) -> Iterator[List[T]]:
+    """iterable 을 최대 n 개씩 리스트로 잘라 넘겨준다(전체를 한 번에 들고 있지 않음)."""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, n))
+        if not batch:
+            return
+        yield batch
+
+
 def personalize(template: Optional[str], name: str) -> Optional[str]:
     if template is None:
         return None
@@ -282,7 +458,7 @@ def personalize(template: Optional[str], name: str) -> Optional[str]:
 
 def build_message(sender: str, subject: str, text_body: Optional[str], html_body: Optional[str]) -> emails.Message:
     """emails.Message 객체를 생성해 반환한다.
-    헤더 직접 접근은 하지 않으며, 수신자 지정은 send() 단계에서 처리한다.
+    헤더 직접 접근은 하지 않으며, 수신자 지정은 send_via_emails() 단계에서 처리한다.
     """
     msg = emails.Message(
         subject=subject,
@@ -293,7 +469,12 @@ def build_message(sender: str, subject: str, text_body: Optional[str], html_body
     return msg
 
 
-def add_attachments(msg: emails.Message, paths: Iterable[str]) -> None:
+def load_attachments(paths: Iterable[str]) -> Tuple[Attachment, ...]:
+    """첨부 파일을 한 번만 읽어 (파일명, 데이터, maintype, subtype) 튜플로 돌려준다.
+    수신자/배치마다 같은 파일을 디스크에서 다시 읽거나 MIME 타입을 다시 추측하지 않도록 발송 전에 호출하며,
+    결과는 여러 발송 스레드가 함께 읽으므로 바꿀 수 없는 튜플로 고정한다.
+    """
+    out: List[Attachment] = []
     for raw in paths or []:
         if not raw:
             continue
@@ -304,99 +485,159 @@ def add_attachments(msg: emails.Message, paths: Iterable[str]) -> None:
         ctype, _ = mimetypes.guess_type(p.name)
         maintype, subtype = ('application', 'octet-stream') if not ctype else ctype.split('/', 1)
         data = p.read_bytes()
-        msg.attach(filename=p.name, data=data, maintype=maintype, subtype=subtype)
-        LOG.debug('첨부 추가: %s (%s/%s, %d bytes)', p.name, maintype, subtype, len(data))
+        out.append((p.name, data, maintype, subtype))
+        LOG.debug('첨부 로드: %s (%s/%s, %d bytes)', p.name, maintype, subtype, len(data))
+    return tuple(out)
+
 
+def add_attachments(msg: emails.Message, attachments: Iterable[Attachment]) -> None:
+    for filename, data, maintype, subtype in attachments:
+        msg.attach(filename=filename, data=data, maintype=maintype, subtype=subtype)
 
-def send_via_emails(msg: emails.Message, username: str, password: str, config: SmtpConfig, to: List[str], cc: Optional[List[str]] = None, bcc: Optional[List[str]] = None) -> object:
-    """emails.Message.send() 호출 래퍼.
-    일부 버전에서 cc/bcc 인자를 지원하지 않을 수 있어 폴백 처리한다.
+
+def render_message(msg: emails.Message, to: List[str], cc: Optional[List[str]] = None) -> Tuple[str, str]:
+    """To/Cc 헤더를 채운 메시지를 한 번 직렬화해 (봉투 발신 주소, 메시지 문자열)로 돌려준다.
+    Bcc 는 헤더에 넣지 않고 전송 시 봉투 수신자에만 포함한다.
     """
-    smtp_dict = config.to_emails_smtp_dict(username=username, password=password)
-    try:
-        return msg.send(to=to, cc=cc, bcc=bcc, smtp=smtp_dict)
-    except TypeError:
-        # cc/bcc 인자를 지원하지 않는 버전인 경우: 수신자 리스트에 합쳐서 전송
-        merged = list(to or [])
-        if cc:
-            merged.extend(cc)
-        if bcc:
-            merged.extend(bcc)
-        return msg.send(to=merged, smtp=smtp_dict)
+    msg.mail_to = list(to or [])
+    if cc:
+        msg.cc = list(cc)
+    _, from_addr = msg.mail_from
+    return from_addr, msg.as_string()
+
+
+def send_via_emails(msg: emails.Message, session: SmtpSession, to: List[str], cc: Optional[List[str]] = None, bcc: Optional[List[str]] = None) -> dict:
+    """열려 있는 SmtpSession 으로 메시지를 전송한다(메시지마다 접속/로그인하지 않음).
+    반환값은 거부된 수신자 딕셔너리(모두 성공이면 빈 dict).
+    """
+    from_addr, data = render_message(msg, to, cc)
+    return session.sendmail(from_addr, [*(to or []), *(cc or []), *(bcc or [])], data)
+
+
+def send_with_retry(session: SmtpSession, from_addr: str, rcpts: List[str], data: str) -> dict:
+    """이미 직렬화한 메시지를 전송하되, 발송 속도 제한 같은 일시적 거부(4xx)면
+    SMTP_RETRY_BACKOFF_SEC 부터 두 배씩 늘려 기다렸다가 SMTP_RETRY_MAX 번까지 다시 보낸다.
+    """
+    delay = SMTP_RETRY_BACKOFF_SEC
+    for attempt in range(SMTP_RETRY_MAX + 1):
+        try:
+            return session.sendmail(from_addr, rcpts, data)
+        except smtplib.SMTPResponseException as exc:
+            if exc.smtp_code not in SMTP_RETRY_CODES or attempt == SMTP_RETRY_MAX:
+                raise
+            LOG.warning('일시적 거부(%d), %.0f초 후 재시도: %s', exc.smtp_code, delay, rcpts)
+        except smtplib.SMTPRecipientsRefused as exc:
+            codes = {code for code, _ in exc.recipients.values()}
+            if not codes <= SMTP_RETRY_CODES or attempt == SMTP_RETRY_MAX:
+                raise
+            LOG.warning('일시적 거부(%s), %.0f초 후 재시도: %s', sorted(codes), delay, rcpts)
+        time.sleep(delay)
+        delay *= 2
 
 
 # -----------------------------
 # 발송 모드
 # -----------------------------
-def run_mode_bcc(username: str, password: str, cfg: SmtpConfig, sender: str, subject: str, text_body: Optional[str], html_body: Optional[str], cc: List[str], bcc_fixed: List[str], csv_targets: List[Dict[str, str]], chunk_size: int, dry_run: bool, attachments: List[str]) -> int:
-    all_rcpts = [t['email'] for t in csv_targets]
-    LOG.info('Bcc 대상: %d명', len(all_rcpts))
+def run_mode_bcc(session: SmtpSession, sender: str, subject: str, text_body: Optional[str], html_body: Optional[str], cc: List[str], bcc_fixed: List[str], csv_targets: Iterable[Target], chunk_size: int, dry_run: bool, attachments: Tuple[Attachment, ...]) -> int:
+    all_rcpts = (email_addr for _, email_addr in csv_targets)
 
     if dry_run:
-        LOG.info('[DRY-RUN] bcc=%d, cc=%d', len(all_rcpts) + len(bcc_fixed), len(cc))
-        return 0
-
-    if not all_rcpts:
-        LOG.warning('Bcc 대상이 없습니다.')
+        total = sum(1 for _ in all_rcpts)
+        LOG.info('Bcc 대상: %d명', total)
+        LOG.info('[DRY-RUN] bcc=%d, cc=%d', total + len(bcc_fixed), len(cc))
         return 0
 
     total_ok = 0
     total_fail = 0
 
-    for i in range(0, len(all_rcpts), max(1, chunk_size)):
-        batch = all_rcpts[i:i + chunk_size]
-        msg = build_message(sender=sender, subject=subject, text_body=text_body, html_body=html_body)
-        add_attachments(msg, attachments)
+    # 헤더/본문/첨부가 모든 배치에서 같으므로 메시지는 한 번만 만들어 직렬화하고,
+    # 배치마다 봉투 수신자만 바꿔 같은 문자열을 보낸다.
+    # To에는 발신자(표시용)만 넣고, 실제 수신자는 bcc(봉투 수신자)로
+    msg = build_message(sender=sender, subject=subject, text_body=text_body, html_body=html_body)
+    add_attachments(msg, attachments)
+    to_list = [sender]
+    cc_list = cc or []
+    from_addr, data = render_message(msg, to=to_list, cc=cc_list)
 
-        # To에는 발신자(표시용)만 넣고, 실제 수신자는 bcc로
-        to_list = [sender]
-        cc_list = cc or []
-        bcc_list = batch + (bcc_fixed or [])
+    for batch in chunked(all_rcpts, max(1, chunk_size)):
+        rcpts = to_list + cc_list + batch + (bcc_fixed or [])
 
         try:
-            resp = send_via_emails(msg, username, password, cfg, to=to_list, cc=cc_list, bcc=bcc_list)
-            code = getattr(resp, 'status_code', None)
-            LOG.info('Bcc 배치 전송 %d명 완료%s', len(batch), f' (status_code={code})' if code else '')
+            refused = send_with_retry(session, from_addr, rcpts, data)
+            LOG.info('Bcc 배치 전송 %d명 완료%s', len(batch), f' (거부: {refused})' if refused else '')
             total_ok += len(batch)
         except Exception as exc:
             LOG.error('Bcc 배치 전송 실패(%d명): %s', len(batch), exc)
             total_fail += len(batch)
 
+    if total_ok + total_fail == 0:
+        LOG.warning('Bcc 대상이 없습니다.')
+        return 0
+
     LOG.info('Bcc 전체 결과: 성공 %d / 실패 %d', total_ok, total_fail)
     return 0 if total_fail == 0 else 1
 
 
-def run_mode_loop(username: str, password: str, cfg: SmtpConfig, sender: str, subject: str, text_tmpl: Optional[str], html_tmpl: Optional[str], cc: List[str], bcc_fixed: List[str], csv_targets: List[Dict[str, str]], dry_run: bool, attachments: List[str]) -> int:
-    success = 0
-    failed = 0
-
-    for idx, t in enumerate(csv_targets, start=1):
-        name = t['name']
-        email_addr = t['email']
+def send_one(pool: SmtpSessionPool, sender: str, subject: str, text_tmpl: Optional[str], html_tmpl: Optional[str], cc: List[str], bcc_fixed: List[str], target: Target, attachments: Tuple[Attachment, ...]) -> dict:
+    """수신자 한 명에게 개인화한 메시지를 만들어, 풀에서 빌린 세션으로 전송한다(스레드에서 호출)."""
+    name, email_addr = target
+    msg = build_message(
+        sender=sender,
+        subject=subject,
+        text_body=personalize(text_tmpl, name),
+        html_body=personalize(html_tmpl, name),
+    )
+    add_attachments(msg, attachments)
+    to_list = [email_addr]
+    from_addr, data = render_message(msg, to=to_list, cc=cc)
 
-        text_body = personalize(text_tmpl, name)
-        html_body = personalize(html_tmpl, name)
+    with pool.session() as session:
+        return send_with_retry(session, from_addr, to_list + (cc or []) + (bcc_fixed or []), data)
 
-        msg = build_message(sender=sender, subject=subject, text_body=text_body, html_body=html_body)
-        add_attachments(msg, attachments)
 
-        to_list = [email_addr]
-        cc_list = cc or []
-        bcc_list = bcc_fixed or []
+def run_mode_loop(pool: SmtpSessionPool, sender: str, subject: str, text_tmpl: Optional[str], html_tmpl: Optional[str], cc: List[str], bcc_fixed: List[str], csv_targets: Iterable[Target], dry_run: bool, attachments: Tuple[Attachment, ...]) -> int:
+    """수신자별 전송을 pool.size 개의 스레드(각자 SMTP 세션 하나)로 동시에 처리한다.
+    CSV 스트림을 끝까지 미리 읽지 않도록, 진행 중인 전송은 pool.size * 2 개까지만 유지한다.
+    """
+    success = 0
+    failed = 0
 
-        if dry_run:
-            LOG.info('[DRY-RUN] (%d/%d) %s <%s>', idx, len(csv_targets), name, email_addr)
+    if dry_run:
+        for idx, (name, email_addr) in enumerate(csv_targets, start=1):
+            msg = build_message(
+                sender=sender,
+                subject=subject,
+                text_body=personalize(text_tmpl, name),
+                html_body=personalize(html_tmpl, name),
+            )
+            add_attachments(msg, attachments)
+            LOG.info('[DRY-RUN] (%d) %s <%s>', idx, name, email_addr)
             success += 1
-            continue
+        LOG.info('루프 전체 결과: 성공 %d / 실패 %d', success, failed)
+        return 0
 
-        try:
-            resp = send_via_emails(msg, username, password, cfg, to=to_list, cc=cc_list, bcc=bcc_list)
-            code = getattr(resp, 'status_code', None)
-            LOG.info('성공: %s <%s>%s', name, email_addr, f' (status_code={code})' if code else '')
-            success += 1
-        except Exception as exc:
-            LOG.error('실패: %s <%s> (%s)', name, email_addr, exc)
-            failed += 1
+    pending: Dict[object, Target] = {}
+
+    def collect(done) -> None:
+        nonlocal success, failed
+        for fut in done:
+            name, email_addr = pending.pop(fut)
+            try:
+                refused = fut.result()
+                LOG.info('성공: %s <%s>%s', name, email_addr, f' (거부: {refused})' if refused else '')
+                success += 1
+            except Exception as exc:
+                LOG.error('실패: %s <%s> (%s)', name, email_addr, exc)
+                failed += 1
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        for t in csv_targets:
+            if len(pending) >= pool.size * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            fut = executor.submit(send_one, pool, sender, subject, text_tmpl, html_tmpl, cc, bcc_fixed, t, attachments)
+            pending[fut] = t
+        collect(wait(pending).done)
 
     LOG.info('루프 전체 결과: 성공 %d / 실패 %d', success, failed)
     return 0 if failed == 0 else 1
@@ -427,6 +668,12 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         LOG.error('본문 처리 오류: %s', exc)
         return 1
 
+    try:
+        attachments = load_attachments(args.attachments)
+    except Exception as exc:
+        LOG.error('첨부 처리 오류: %s', exc)
+        return 1
+
     password = args.password or getpass.getpass('SMTP 비밀번호(앱 비밀번호 권장): ')
 
     cfg = SmtpConfig(host=args.host, port=args.port, use_ssl=args.use_ssl, timeout=args.timeout)
@@ -434,42 +681,40 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     # CSV 모드
     if args.csv_path:
         try:
-            targets = parse_csv(args.csv_path, preferred_encoding=args.encoding)
+            targets = iter_csv(args.csv_path, preferred_encoding=args.encoding)
         except Exception as exc:
             LOG.error('CSV 처리 오류: %s', exc)
             return 1
 
         if args.mode == 'bcc':
-            return run_mode_bcc(
-                username=args.username,
-                password=password,
-                cfg=cfg,
-                sender=sender,
-                subject=args.subject,
-                text_body=text_body,
-                html_body=html_body,
-                cc=cc,
-                bcc_fixed=bcc,
-                csv_targets=targets,
-                chunk_size=args.chunk_size,
-                dry_run=args.dry_run,
-                attachments=args.attachments,
-            )
+            with SmtpSession(cfg, args.username, password) as session:
+                return run_mode_bcc(
+                    session=session,
+                    sender=sender,
+                    subject=args.subject,
+                    text_body=text_body,
+                    html_body=html_body,
+                    cc=cc,
+                    bcc_fixed=bcc,
+                    csv_targets=targets,
+                    chunk_size=args.chunk_size,
+                    dry_run=args.dry_run,
+                    attachments=attachments,
+                )
         else:
-            return run_mode_loop(
-                username=args.username,
-                password=password,
-                cfg=cfg,
-                sender=sender,
-                subject=args.subject,
-                text_tmpl=text_body,
-                html_tmpl=html_body,
-                cc=cc,
-                bcc_fixed=bcc,
-                csv_targets=targets,
-                dry_run=args.dry_run,
-                attachments=args.attachments,
-            )
+            with SmtpSessionPool(cfg, args.username, password, size=args.workers) as pool:
+                return run_mode_loop(
+                    pool=pool,
+                    sender=sender,
+                    subject=args.subject,
+                    text_tmpl=text_body,
+                    html_tmpl=html_body,
+                    cc=cc,
+                    bcc_fixed=bcc,
+                    csv_targets=targets,
+                    dry_run=args.dry_run,
+                    attachments=attachments,
+                )
 
     # 비-CSV(원래 모드): --to 필수
     if not to:
@@ -478,7 +723,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
 
     try:
         msg = build_message(sender=sender, subject=args.subject, text_body=text_body, html_body=html_body)
-        add_attachments(msg, args.attachments)
+        add_attachments(msg, attachments)
     except FileNotFoundError as exc:
         LOG.error('첨부/본문 파일 오류: %s', exc)
         return 1
@@ -491,9 +736,9 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     recipients_bcc = bcc or []
 
     try:
-        resp = send_via_emails(msg, username=args.username, password=password, config=cfg, to=recipients_to, cc=recipients_cc, bcc=recipients_bcc)
-        code = getattr(resp, 'status_code', None)
-        LOG.info('메일 전송 완료%s', f' (status_code={code})' if code else '')
+        with SmtpSession(cfg, args.username, password) as session:
+            refused = send_via_emails(msg, session, to=recipients_to, cc=recipients_cc, bcc=recipients_bcc)
+        LOG.info('메일 전송 완료%s', f' (거부: {refused})' if refused else '')
         return 0
     except smtplib.SMTPAuthenticationError as exc:
         LOG.error('인증 실패: 2단계 인증 후 발급한 "앱 비밀번호"를 사용하세요. (%s)', exc)
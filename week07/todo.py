@@ -49,7 +49,14 @@ curl "http://127.0.0.1:8000/todos"
 """
 
 from typing import Any, Dict, List
-from fastapi import FastAPI, APIRouter, HTTPException, status
+from fastapi import FastAPI, APIRouter, HTTPException, Response, status
+from fastapi.responses import JSONResponse
+
+try:
+    # 설치되어 있으면 조회 응답 직렬화에 orjson 사용(C 구현, bytes 로 바로 직렬화)
+    import orjson
+except ImportError:
+    orjson = None
 
 # 전역 리스트 (요소 타입: Dict)
 todo_list: List[Dict[str, Any]] = []
@@ -75,13 +82,23 @@ def add_todo(payload: Dict[str, Any]) -> Dict[str, Any]:
     return {'ok': True, 'saved': payload}
 
 
-@router.get('/todos')
-def retrieve_todo() -> Dict[str, List[Dict[str, Any]]]:
+@router.get('/todos', responses={200: {'model': Dict[str, List[Dict[str, Any]]]}})
+def retrieve_todo() -> Response:
     """
     현재 todo_list를 Dict로 감싸 반환한다.
     - 반환: {'todos': [...]}
+    - 저장된 항목은 이미 JSON 으로 받은 값이므로 응답 모델 검증/jsonable_encoder 를 거치지 않고
+      바로 직렬화한다(orjson 이 있으면 orjson, 없으면 표준 json).
+    - 입력 Dict 의 값은 타입이 정해져 있지 않으므로, orjson 이 인코딩하지 못하는 값
+      (예: 64비트를 넘는 정수)이 저장되어 있으면 표준 json(JSONResponse)으로 보낸다.
     """
-    return {'todos': todo_list}
+    content = {'todos': todo_list}
+    if orjson is not None:
+        try:
+            return Response(orjson.dumps(content), media_type='application/json')
+        except orjson.JSONEncodeError:
+            pass
+    return JSONResponse(content)
 
 
 # FastAPI 앱 및 라우터 연결
@@ -1,26 +1,38 @@
 # main.py
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
 
 from database import SessionLocal
 from models import Question
 
 
-def create_sample_question():
+def create_sample_questions(count: int = 1):
+    # 컬럼이 timezone 없는 DateTime 이므로 UTC 기준 naive 값으로 저장
+    # (datetime.utcnow()는 3.12부터 deprecated)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
     db = SessionLocal()
     try:
-        q = Question(
-            subject="첫 번째 질문",
-            content="ORM과 Alembic으로 만든 첫 질문입니다.",
-            create_date=datetime.utcnow(),
-        )
-        db.add(q)
+        questions = [
+            Question(
+                subject="첫 번째 질문" if count == 1 else f"{i}번째 질문",
+                content="ORM과 Alembic으로 만든 첫 질문입니다.",
+                create_date=now,
+            )
+            for i in range(1, count + 1)
+        ]
+        # 한 세션에서 모두 추가하고 commit도 한 번만 (행마다 commit하면 그때마다 디스크에 기록)
+        db.add_all(questions)
+        db.flush()       # INSERT 후 id가 채워지므로 commit 뒤 행마다 refresh 할 필요 없음
+        ids = [q.id for q in questions]
         db.commit()      # autocommit=False라서 commit 꼭 필요
-        db.refresh(q)
 
-        print("생성된 Question ID:", q.id)
+        print("생성된 Question ID:", ", ".join(map(str, ids)))
+        return ids
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    create_sample_question()
\ No newline at end of file
+    # python main.py [개수]  (기본 1개)
+    create_sample_questions(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
\ No newline at end of file
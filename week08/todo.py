@@ -4,7 +4,7 @@
 """
 FastAPI 기반 TODO 리스트 API (v2)
 
-- todo_list: 메모리 상의 리스트로 TODO들을 관리
+- todo_by_id: 메모리 상의 dict(id -> TODO)로 TODO들을 관리
 - APIRouter를 사용해 라우팅 구성
 - 기본 기능 (예시)
   - 전체 조회   : GET  /todo
@@ -17,11 +17,21 @@ FastAPI 기반 TODO 리스트 API (v2)
   - 수정용 모델 : TodoItem(BaseModel)
 """
 
-from typing import List, Optional
+from itertools import count
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, Header, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+try:
+    # 설치되어 있으면 조회 응답 직렬화에 orjson 사용(C 구현, bytes 로 바로 직렬화)
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------
 # Pydantic 모델 정의
@@ -64,11 +74,27 @@ class TodoItem(BaseModel):
 # ---------------------------------------------------------
 
 app = FastAPI()
+# TODO가 많아져 커진 응답(주로 GET /todo)만 gzip 으로 압축해 보낸다.
+# 작은 응답은 압축 비용이 더 크므로 그대로 보낸다.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 router = APIRouter()
 
-# 메모리 상에 TODO들을 저장할 리스트
+# 메모리 상에 TODO들을 저장할 dict (id -> TODO)
 # 실제 DB는 아니고, 서버가 떠 있는 동안만 유지된다.
-todo_list: List[dict] = []
+# id로 바로 찾으므로 개별 조회/수정/삭제가 목록 길이와 상관없이 O(1)이고,
+# dict는 추가한 순서를 유지하므로 전체 조회 순서도 리스트와 같다.
+todo_by_id: Dict[int, dict] = {}
+
+# 다음에 발급할 id (1부터 계속 증가, 삭제된 id도 다시 쓰지 않는다)
+# count()의 next()는 C로 구현되어 있어 여러 요청이 동시에 불러도 같은 id가 나오지 않는다.
+_id_counter = count(1)
+
+# 전체 목록의 ETag. 목록이 바뀔 때(추가/수정/삭제)마다 새 값으로 바꾼다.
+# 클라이언트가 If-None-Match 로 같은 값을 보내면 목록을 다시 직렬화하지 않고 304 로 응답한다.
+# 서버를 다시 띄웠을 때 이전 ETag 와 겹치지 않도록 실행마다 다른 접두어를 붙인다.
+_ETAG_PREFIX = uuid4().hex[:8]
+_list_version = count(1)
+_list_etag = f'"{_ETAG_PREFIX}-0"'
 
 
 # ---------------------------------------------------------
@@ -77,24 +103,42 @@ todo_list: List[dict] = []
 
 def _get_next_id() -> int:
     """
-    todo_list 에서 다음에 사용할 id를 계산한다.
-    리스트가 비어있으면 1부터 시작.
+    다음에 사용할 id를 발급한다.
+    마지막 TODO를 삭제한 뒤 추가해도 이전 id와 겹치지 않는다.
+    """
+    return next(_id_counter)
+
+
+def _touch_list() -> None:
+    """
+    목록이 바뀌었음을 알린다(ETag 갱신).
+    count()의 next()로 값을 받으므로 동시에 불려도 같은 ETag가 두 번 나오지 않는다.
+    """
+    global _list_etag
+    _list_etag = f'"{_ETAG_PREFIX}-{next(_list_version)}"'
+
+
+def _get_todo_or_404(todo_id: int) -> dict:
+    """
+    todo_id 값으로 TODO를 찾는 헬퍼 함수.
+    - 찾으면 해당 TODO(dict)
+    - 못 찾으면 404 HTTPException
     """
-    if not todo_list:
-        return 1
-    return todo_list[-1]["id"] + 1
+    todo = todo_by_id.get(todo_id)
+    if todo is None:
+        raise HTTPException(status_code=404, detail="Todo not found")
+    return todo
 
 
-def _find_todo_index_by_id(todo_id: int) -> int:
+def _json_response(content: Any) -> Response:
     """
-    todo_id 값으로 todo_list 내의 인덱스를 찾는 헬퍼 함수.
-    - 찾으면 해당 인덱스(int)
-    - 못 찾으면 -1
+    저장된 TODO는 이미 JSON으로 바꿀 수 있는 dict/list 이므로
+    jsonable_encoder를 거치지 않고 바로 직렬화해 응답한다.
+    (orjson이 있으면 orjson, 없으면 표준 json을 쓰는 JSONResponse)
     """
-    for index, todo in enumerate(todo_list):
-        if todo["id"] == todo_id:
-            return index
-    return -1
+    if orjson is None:
+        return JSONResponse(content)
+    return Response(orjson.dumps(content), media_type="application/json")
 
 
 # ---------------------------------------------------------
@@ -102,13 +146,22 @@ def _find_todo_index_by_id(todo_id: int) -> int:
 # (너의 todo.py에 이미 있던 내용일 가능성이 높은 부분)
 # ---------------------------------------------------------
 
-@router.get("/todo")
-def get_todo_list():
+@router.get("/todo", responses={200: {"model": List[Dict[str, Any]]}, 304: {}})
+def get_todo_list(if_none_match: Optional[str] = Header(None)) -> Response:
     """
     TODO 전체 리스트 조회
     GET /todo
+
+    응답에 ETag 헤더를 붙이고, If-None-Match 가 현재 ETag 와 같으면
+    목록을 직렬화하지 않고 바디 없이 304 Not Modified 로 응답한다.
     """
-    return todo_list
+    etag = _list_etag
+    if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response = _json_response(list(todo_by_id.values()))
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.post("/todo")
@@ -131,7 +184,8 @@ def add_todo(item: TodoCreate):
         "description": item.description,
         "is_done": item.is_done,
     }
-    todo_list.append(todo_dict)
+    todo_by_id[new_id] = todo_dict
+    _touch_list()
     return todo_dict
 
 
@@ -142,8 +196,8 @@ def add_todo(item: TodoCreate):
 # 3) 삭제:     delete_single_todo()
 # ---------------------------------------------------------
 
-@router.get("/todo/{todo_id}")
-def get_single_todo(todo_id: int):
+@router.get("/todo/{todo_id}", responses={200: {"model": Dict[str, Any]}})
+def get_single_todo(todo_id: int) -> Response:
     """
     개별 조회 기능
     - 함수 이름: get_single_todo()
@@ -153,11 +207,7 @@ def get_single_todo(todo_id: int):
     예)
     GET /todo/1
     """
-    index = _find_todo_index_by_id(todo_id)
-    if index == -1:
-        raise HTTPException(status_code=404, detail="Todo not found")
-
-    return todo_list[index]
+    return _json_response(_get_todo_or_404(todo_id))
 
 
 @router.put("/todo/{todo_id}")
@@ -169,18 +219,14 @@ def update_todo(todo_id: int, item: TodoItem):
     - 경로 매개변수로 id를 받는다.
     - Request Body는 TodoItem(BaseModel)을 사용한다.
     """
-    index = _find_todo_index_by_id(todo_id)
-    if index == -1:
-        raise HTTPException(status_code=404, detail="Todo not found")
-
-    stored = todo_list[index]
+    stored = _get_todo_or_404(todo_id)
 
-    update_data = item.dict(exclude_unset=True)
-    # 넘어온 값만 기존 dict에 덮어쓰기
-    for key, value in update_data.items():
-        stored[key] = value
+    # 요청에 넘어온 필드만 기존 dict에 덮어쓰기 (저장된 dict를 그대로 수정하므로 다시 넣을 필요 없음)
+    # model_fields_set 으로 필드를 바로 읽어, exclude_unset 용 중간 dict를 만들지 않는다.
+    for key in item.model_fields_set:
+        stored[key] = getattr(item, key)
+    _touch_list()
 
-    todo_list[index] = stored
     return stored
 
 
@@ -193,11 +239,11 @@ def delete_single_todo(todo_id: int):
     - 경로 매개변수로 id를 받는다.
 
     """
-    index = _find_todo_index_by_id(todo_id)
-    if index == -1:
+    deleted = todo_by_id.pop(todo_id, None)
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Todo not found")
+    _touch_list()
 
-    deleted = todo_list.pop(index)
     return deleted
 
 
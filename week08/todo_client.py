@@ -27,21 +27,112 @@ class TodoItem(BaseModel):
 사용자는 JSON을 직접 안 쳐도 된다.
 """
 
+import gzip
 import json
-from typing import Optional, Dict, Any
+import sys
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
+from urllib.parse import urlsplit
 
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+try:
+    # 설치되어 있으면 요청/응답 JSON 처리에 orjson 사용(C 구현, bytes 로 바로 직렬화/파싱)
+    import orjson
+except ImportError:
+    orjson = None
 
 
 BASE_URL = "http://127.0.0.1:8000"
 TODO_PATH = "/todo"  # 서버 코드와 동일하게 /todo 로 통일
+REQUEST_TIMEOUT = 10  # 초
+
+# 모든 요청에 같은 헤더를 쓰므로 요청마다 dict 를 새로 만들지 않고 한 번만 만들어 둔다
+# (http.client 는 넘겨받은 헤더 dict 를 수정하지 않는다)
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+}
+_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# GET 응답 캐시 (경로 -> (ETag, 파싱한 응답)). 서버가 ETag 를 준 경로(GET /todo)만 담긴다.
+# 다음 GET 때 If-None-Match 로 보내고, 바뀐 게 없어 304 가 오면 캐시한 값을 그대로 쓴다.
+_etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+# 표준입력이 파이프/파일이면(스크립트 실행) 처음 입력을 읽을 때 한 번에 모두 읽어 두고 한 줄씩 꺼내 쓴다.
+# 터미널이면 False 로 두고 input()을 그대로 쓴다. 아직 확인 전이면 None.
+_stdin_lines: Union[Iterator[str], bool, None] = None
+
+# 메뉴를 오가며 보내는 요청들이 TCP 연결 하나를 계속 쓰도록(HTTP/1.1 keep-alive)
+# 연결을 모듈 전역에 두고 재사용한다. 처음 요청할 때 연결한다.
+# HTTP/2 는 쓰지 않는다: 서버(uvicorn)는 평문 HTTP/2(h2c)를 지원하지 않고,
+# 메뉴는 요청을 하나씩 순서대로 보내므로 다중화로 얻을 것이 없다.
+_BASE = urlsplit(BASE_URL)
+_conn: Optional[HTTPConnection] = None
+
+# orjson 이 없을 때만 쓰는 표준 json 인코더.
+# 호출마다 JSONEncoder 를 새로 만들지 않도록 한 번 만들어 두고, 공백 없는 구분자로 바디를 줄인다.
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 
 
 # ---------------------------------------------------------
 # 공통 HTTP 요청 함수
 # ---------------------------------------------------------
 
+def _dumps(data: Any) -> bytes:
+    """요청 바디용 JSON bytes 생성 (orjson 은 UTF-8 bytes 를 바로 반환)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _json_encode(data).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """응답 바디(bytes)를 str 로 디코딩하지 않고 바로 파싱"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _get_connection() -> HTTPConnection:
+    """재사용할 연결을 돌려준다(없으면 새로 만든다)."""
+    global _conn
+    if _conn is None:
+        conn_class = HTTPSConnection if _BASE.scheme == "https" else HTTPConnection
+        _conn = conn_class(_BASE.hostname, _BASE.port, timeout=REQUEST_TIMEOUT)
+    return _conn
+
+
+def _close_connection() -> None:
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _request(method: str, url: str, body: Optional[bytes], headers: Dict[str, str]):
+    """
+    keep-alive 연결로 요청을 보내고 (상태 코드, 사유, 바디 bytes, ETag)를 돌려준다.
+    서버가 gzip 으로 압축해 보낸 바디(큰 목록 응답)는 풀어서 돌려준다.
+    재사용하던 연결을 서버가 먼저 닫았다면(유휴 타임아웃 등) 새로 연결해 한 번만 다시 보낸다.
+    """
+    for attempt in range(2):
+        reused = _conn is not None
+        conn = _get_connection()
+        try:
+            conn.request(method, url, body=body, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            if resp.getheader("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
+            return resp.status, resp.reason, raw, resp.getheader("ETag")
+        except (ConnectionResetError, BrokenPipeError, HTTPException):
+            _close_connection()
+            if not reused or attempt:
+                raise
+        except OSError:
+            _close_connection()
+            raise
+
+
 def send_request(method: str, path: str, data: Optional[Dict[str, Any]] = None):
     """
     단순 HTTP 요청 함수
@@ -49,40 +140,73 @@ def send_request(method: str, path: str, data: Optional[Dict[str, Any]] = None):
     - path  : "/todo", "/todo/1" 같은 경로
     - data  : JSON 바디로 보낼 dict (없으면 None)
     """
-    url = BASE_URL + path
-    headers = {"Content-Type": "application/json"}
+    if method not in _METHODS:
+        raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
 
-    if data is not None:
-        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
-    else:
-        body = None
+    url = _BASE.path.rstrip("/") + path
+    body = _dumps(data) if data is not None else None
 
-    req = Request(url, data=body, headers=headers, method=method)
+    headers = _HEADERS
+    cached = _etag_cache.get(path) if method == "GET" else None
+    if cached is not None:
+        headers = {**_HEADERS, "If-None-Match": cached[0]}
 
     try:
-        with urlopen(req) as resp:
-            raw = resp.read().decode("utf-8")
-            if raw:
-                try:
-                    return json.loads(raw)
-                except json.JSONDecodeError:
-                    return raw
-            return None
-    except HTTPError as e:
-        print(f"[HTTP Error] {e.code} {e.reason}")
-        try:
-            err_body = e.read().decode("utf-8")
-            if err_body:
-                print("서버 응답:", err_body)
-        except Exception:
-            pass
-    except URLError as e:
-        print(f"[URL Error] {e.reason}")
+        status, reason, raw, etag = _request(method, url, body, headers)
+    except (OSError, HTTPException) as e:
+        print(f"[URL Error] {e}")
+        return None
     except Exception as e:
         print(f"[Error] {e}")
+        return None
+
+    if status == 304 and cached is not None:
+        # 서버 목록이 그대로이므로 바디를 받지도, 파싱하지도 않는다
+        return cached[1]
+
+    if status >= 400:
+        print(f"[HTTP Error] {status} {reason}")
+        if raw:
+            print("서버 응답:", raw.decode("utf-8", errors="replace"))
+        return None
+
+    if raw:
+        try:
+            result = _loads(raw)
+        except ValueError:
+            # json.JSONDecodeError / orjson.JSONDecodeError 모두 ValueError 하위 클래스
+            return raw.decode("utf-8")
+        if method == "GET" and etag:
+            _etag_cache[path] = (etag, result)
+        return result
     return None
 
 
+# ---------------------------------------------------------
+# 입력 함수
+# ---------------------------------------------------------
+
+def _readline(prompt: str) -> str:
+    """
+    input() 대신 쓰는 입력 함수
+    - 터미널에서 실행하면 input()과 같다.
+    - 입력을 파이프로 넘긴 경우에는 줄마다 read 시스템 콜을 하지 않도록
+      남은 입력을 한 번에 읽어 두고 한 줄씩 돌려준다(프롬프트는 똑같이 출력).
+    - 입력이 끝나면 input()처럼 EOFError 를 낸다.
+    """
+    global _stdin_lines
+    if _stdin_lines is None:
+        _stdin_lines = False if sys.stdin.isatty() else iter(sys.stdin.read().splitlines())
+    if _stdin_lines is False:
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    try:
+        return next(_stdin_lines)
+    except StopIteration:
+        raise EOFError from None
+
+
 # ---------------------------------------------------------
 # 각 기능별 클라이언트 함수
 # ---------------------------------------------------------
@@ -99,7 +223,7 @@ def _input_bool(prompt: str, default: bool) -> bool:
     y/n 입력 받아서 bool 로 변환
     빈 입력 시 default 사용
     """
-    raw = input(f"{prompt} (y/n, 엔터 시 {default}): ").strip().lower()
+    raw = _readline(f"{prompt} (y/n, 엔터 시 {default}): ").strip().lower()
     if raw == "":
         return default
     if raw in ("y", "yes", "1", "true", "t"):
@@ -113,12 +237,12 @@ def _input_bool(prompt: str, default: bool) -> bool:
 def create_todo():
     """TODO 추가: POST /todo"""
     print("\n[TODO 추가]")
-    title = input("제목(title)을 입력하세요: ").strip()
+    title = _readline("제목(title)을 입력하세요: ").strip()
     if not title:
         print("title은 비어 있을 수 없습니다. 추가하지 않습니다.")
         return
 
-    description = input("설명(description)을 입력하세요 (엔터 시 생략): ").strip()
+    description = _readline("설명(description)을 입력하세요 (엔터 시 생략): ").strip()
     is_done = _input_bool("완료 여부(is_done)", default=False)
 
     payload = {
@@ -131,12 +255,77 @@ def create_todo():
     print("응답:", data)
 
 
+def _parse_bulk_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    대량 추가 입력 한 줄("제목|설명|완료여부")을 TodoCreate 형태의 dict 로 변환
+    - 설명/완료여부는 생략 가능, 완료여부는 y/yes/1/true/t 이면 True
+    - 제목이 비어 있으면 None
+    """
+    parts = [part.strip() for part in line.split("|", 2)]
+    title = parts[0]
+    if not title:
+        return None
+    description = parts[1] if len(parts) > 1 and parts[1] else None
+    is_done = len(parts) > 2 and parts[2].lower() in ("y", "yes", "1", "true", "t")
+    return {"title": title, "description": description, "is_done": is_done}
+
+
+def create_todos_bulk(items: List[Dict[str, Any]]) -> List[Any]:
+    """
+    여러 TODO를 POST /todo 로 연달아 보낸다.
+    같은 keep-alive 연결을 계속 쓰므로 요청마다 새로 연결하지 않는다.
+    """
+    return [send_request("POST", TODO_PATH, item) for item in items]
+
+
+def create_todo_bulk_menu():
+    """TODO 대량 추가: 여러 줄을 입력받아 POST /todo 를 연달아 보냄"""
+    print("\n[TODO 대량 추가]")
+    print('한 줄에 하나씩 "제목|설명|완료여부(y/n)" 형식으로 입력하세요. (설명/완료여부 생략 가능)')
+    print("빈 줄을 입력하면 입력을 마치고 전송합니다.")
+
+    items: List[Dict[str, Any]] = []
+    while True:
+        line = _readline("> ").strip()
+        if not line:
+            break
+        item = _parse_bulk_line(line)
+        if item is None:
+            print("제목이 비어 있어 건너뜁니다.")
+            continue
+        items.append(item)
+
+    if not items:
+        print("추가할 TODO가 없습니다. 요청을 보내지 않습니다.")
+        return
+
+    results = create_todos_bulk(items)
+    ok = sum(1 for result in results if result is not None)
+    print(f"응답: {ok}/{len(items)}건 추가됨")
+    for result in results:
+        if result is not None:
+            print(" -", result)
+
+
+def _parse_id(raw: str) -> Optional[int]:
+    """
+    입력한 TODO id 를 양의 정수로 변환 (아니면 None)
+    - 경로에는 변환한 int 를 다시 넣으므로 항상 ASCII 숫자만 들어간다.
+    - 0/음수처럼 서버에서 404 가 날 값은 요청을 보내기 전에 걸러낸다.
+    """
+    try:
+        todo_id = int(raw)
+    except ValueError:
+        return None
+    return todo_id if todo_id > 0 else None
+
+
 def get_single_todo():
     """개별 조회: GET /todo/{id}"""
     print("\n[개별 조회]")
-    todo_id = input("조회할 TODO id를 입력하세요: ").strip()
-    if not todo_id.isdigit():
-        print("id는 숫자여야 합니다.")
+    todo_id = _parse_id(_readline("조회할 TODO id를 입력하세요: "))
+    if todo_id is None:
+        print("id는 1 이상의 정수여야 합니다.")
         return
 
     path = f"{TODO_PATH}/{todo_id}"
@@ -147,15 +336,15 @@ def get_single_todo():
 def update_todo():
     """수정: PUT /todo/{id}"""
     print("\n[TODO 수정]")
-    todo_id = input("수정할 TODO id를 입력하세요: ").strip()
-    if not todo_id.isdigit():
-        print("id는 숫자여야 합니다.")
+    todo_id = _parse_id(_readline("수정할 TODO id를 입력하세요: "))
+    if todo_id is None:
+        print("id는 1 이상의 정수여야 합니다.")
         return
 
     print("빈 값으로 두면 해당 필드는 수정하지 않습니다.")
-    new_title = input("새 제목(title)을 입력하세요 (엔터 시 유지): ").strip()
-    new_description = input("새 설명(description)을 입력하세요 (엔터 시 유지): ").strip()
-    change_done = input("완료 여부(is_done)를 수정하겠습니까? (y/n, 엔터 시 n): ").strip().lower()
+    new_title = _readline("새 제목(title)을 입력하세요 (엔터 시 유지): ").strip()
+    new_description = _readline("새 설명(description)을 입력하세요 (엔터 시 유지): ").strip()
+    change_done = _readline("완료 여부(is_done)를 수정하겠습니까? (y/n, 엔터 시 n): ").strip().lower()
 
     payload: Dict[str, Any] = {}
 
@@ -181,9 +370,9 @@ def update_todo():
 def delete_todo():
     """삭제: DELETE /todo/{id}"""
     print("\n[TODO 삭제]")
-    todo_id = input("삭제할 TODO id를 입력하세요: ").strip()
-    if not todo_id.isdigit():
-        print("id는 숫자여야 합니다.")
+    todo_id = _parse_id(_readline("삭제할 TODO id를 입력하세요: "))
+    if todo_id is None:
+        print("id는 1 이상의 정수여야 합니다.")
         return
 
     path = f"{TODO_PATH}/{todo_id}"
@@ -204,6 +393,7 @@ def print_menu():
     print("3. 개별 조회 (GET /todo/{id})")
     print("4. TODO 수정 (PUT /todo/{id})")
     print("5. TODO 삭제 (DELETE /todo/{id})")
+    print("6. TODO 대량 추가 (POST /todo 연속 전송)")
     print("0. 종료")
     print("==============================")
 
@@ -211,7 +401,7 @@ def print_menu():
 def main():
     while True:
         print_menu()
-        choice = input("번호를 선택하세요: ").strip()
+        choice = _readline("번호를 선택하세요: ").strip()
 
         if choice == "1":
             list_todos()
@@ -223,6 +413,8 @@ def main():
             update_todo()
         elif choice == "5":
             delete_todo()
+        elif choice == "6":
+            create_todo_bulk_menu()
         elif choice == "0":
             print("종료합니다.")
             break
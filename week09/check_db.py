@@ -1,14 +1,19 @@
 # check_db.py
 
+import sys
+
 from sqlalchemy import inspect
 from database import engine
 
-def show_tables():
-    inspector = inspect(engine)
+def show_tables(inspector=None):
+    # 반복 호출할 때는 만들어 둔 inspector 를 넘겨 재사용할 수 있다
+    inspector = inspector or inspect(engine)
     tables = inspector.get_table_names()
-    print("📋 현재 DB에 존재하는 테이블 목록:")
-    for name in tables:
-        print("-", name)
+    # 테이블마다 print 하지 않고 한 번에 모아 출력
+    sys.stdout.write(
+        "📋 현재 DB에 존재하는 테이블 목록:\n"
+        + "".join(f"- {name}\n" for name in tables)
+    )
 
 if __name__ == "__main__":
     show_tables()
\ No newline at end of file
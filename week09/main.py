@@ -1,6 +1,4 @@
 # main.py
-from datetime import datetime
-
 from database import SessionLocal
 from models import Question
 
@@ -8,10 +6,10 @@ from models import Question
 def create_sample_question():
     db = SessionLocal()
     try:
+        # create_date 는 INSERT 때 DB 가 채운다(server_default)
         q = Question(
             subject="첫 번째 질문",
             content="ORM과 Alembic으로 만든 첫 질문입니다.",
-            create_date=datetime.utcnow(),
         )
         db.add(q)
         db.commit()      # autocommit=False라서 commit 꼭 필요
@@ -0,0 +1,28 @@
+"""add answer question_id, create_date index
+
+Revision ID: 5d2c8e71a4b9
+Revises: 133b1dedc242
+Create Date: 2026-10-15 16:02:11.417523
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c8e71a4b9'
+down_revision: Union[str, Sequence[str], None] = '133b1dedc242'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_answer_question_id_create_date', 'answer', ['question_id', 'create_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_answer_question_id_create_date', table_name='answer')
@@ -0,0 +1,50 @@
+"""server default create_date
+
+Revision ID: 9f4b1c3e6d27
+Revises: 5d2c8e71a4b9
+Create Date: 2026-10-15 17:20:43.118902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f4b1c3e6d27'
+down_revision: Union[str, Sequence[str], None] = '5d2c8e71a4b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOT NULL 로 바꾸기 전에 비어 있는 작성일을 채운다
+    op.execute("UPDATE question SET create_date = CURRENT_TIMESTAMP WHERE create_date IS NULL")
+    op.execute("UPDATE answer SET create_date = CURRENT_TIMESTAMP WHERE create_date IS NULL")
+    # SQLite 는 ALTER COLUMN 을 지원하지 않으므로 batch 모드(테이블 재생성)로 변경
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.alter_column('create_date',
+               existing_type=sa.DateTime(),
+               nullable=False,
+               server_default=sa.func.now())
+    with op.batch_alter_table('answer') as batch_op:
+        batch_op.alter_column('create_date',
+               existing_type=sa.DateTime(),
+               nullable=False,
+               server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('answer') as batch_op:
+        batch_op.alter_column('create_date',
+               existing_type=sa.DateTime(),
+               nullable=True,
+               server_default=None)
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.alter_column('create_date',
+               existing_type=sa.DateTime(),
+               nullable=True,
+               server_default=None)
@@ -1,8 +1,8 @@
 # models.py
-from datetime import datetime
+from typing import Any, Dict, List
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, func, insert
+from sqlalchemy.orm import Session, relationship
 
 from database import Base
 
@@ -13,18 +13,55 @@ class Question(Base):
     id = Column(Integer, primary_key=True, index=True)
     subject = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
-    create_date = Column(DateTime, default=datetime.utcnow)
+    # 작성일은 INSERT 때 SQLite 가 직접 채운다(DEFAULT CURRENT_TIMESTAMP, UTC).
+    # 행마다 파이썬에서 datetime 을 만들어 바인딩하지 않아도 된다.
+    create_date = Column(DateTime, nullable=False, server_default=func.now())
 
     # Question 1개 : Answer 여러 개 (일대다)
-    answers = relationship("Answer", back_populates="question")
+    # 질문 N개를 불러올 때 답변을 질문마다 따로 조회(N+1)하지 않도록,
+    # WHERE question_id IN (...) 한 번으로 함께 불러온다(lazy="selectin").
+    # 답변이 필요 없는 조회에서는 .options(noload(Question.answers)) 로 끌 수 있다.
+    answers = relationship(
+        "Answer",
+        back_populates="question",
+        lazy="selectin",
+        order_by="Answer.create_date",
+    )
 
 
 class Answer(Base):
     __tablename__ = "answer"
+    __table_args__ = (
+        # 질문별 답변 조회(WHERE question_id = ? / IN (...))를 전체 스캔 대신 인덱스로 찾고,
+        # 작성일 순 정렬까지 인덱스 순서로 처리한다. question_id 단독 조회도 이 인덱스로 충분하다.
+        Index("ix_answer_question_id_create_date", "question_id", "create_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
-    create_date = Column(DateTime, default=datetime.utcnow)
+    create_date = Column(DateTime, nullable=False, server_default=func.now())
 
     question_id = Column(Integer, ForeignKey("question.id"), nullable=False)
     question = relationship("Question", back_populates="answers")
+
+
+# ---------------------------------------------------------
+# 대량 등록(시드/가져오기)용 함수
+# ---------------------------------------------------------
+# 행마다 session.add(Question(...)) 를 하면 행마다 unit-of-work 처리와 INSERT 가 따로 일어난다.
+# 여기서는 dict 목록을 insert() 한 번으로 넘겨 여러 행을 묶은 INSERT 로 저장한다.
+# (세션의 identity map 을 거치지 않으므로 저장된 객체는 세션에 남지 않는다. 가져오기 용도로는 충분하다.)
+# create_date 를 넣지 않은 행은 DB 기본값(CURRENT_TIMESTAMP)이 채운다.
+
+def bulk_add_questions(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """{"subject": ..., "content": ...} 형태의 dict 목록을 한 번에 저장하고 커밋한다."""
+    if rows:
+        session.execute(insert(Question), rows)
+    session.commit()
+
+
+def bulk_add_answers(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """{"content": ..., "question_id": ...} 형태의 dict 목록을 한 번에 저장하고 커밋한다."""
+    if rows:
+        session.execute(insert(Answer), rows)
+    session.commit()